@@ -1,11 +1,10 @@
 #!/usr/bin/env python3
 """Add route for populate_main_articles.js to app.py"""
+from patch_utils import patch_file
 
-with open('app.py', 'r', encoding='utf-8') as f:
-    lines = f.readlines()
+TARGET = 'app.py'
 
-# Find the line with @app.route('/populate_ai_section.js')
-# and add the new route after its function definition
+# Add the new route right before the data_cache.json route
 new_route = """@app.route('/populate_main_articles.js')
 def serve_main_articles_js():
     \"\"\"Serve main articles population JavaScript\"\"\"
@@ -13,18 +12,22 @@ def serve_main_articles_js():
 
 """
 
-insert_index = None
-for i, line in enumerate(lines):
-    if "@app.route('/data_cache.json')" in line:
-        insert_index = i
-        break
+# Present once the script is served (by its own route or the serve_js
+# allowlist); guards against registering it twice
+MARKER = b"populate_main_articles"
 
-if insert_index:
-    lines.insert(insert_index, new_route)
+PATCHES = [
+    (b"@app.route('/data_cache.json')", new_route.encode('utf-8'), "before"),
+]
 
-    with open('app.py', 'w', encoding='utf-8') as f:
-        f.writelines(lines)
 
-    print("[OK] Added populate_main_articles.js route to app.py")
-else:
-    print("[ERROR] Could not find insertion point in app.py")
+if __name__ == '__main__':
+    try:
+        applied = patch_file(TARGET, PATCHES, marker=MARKER)
+    except LookupError:
+        print("[ERROR] Could not find insertion point in app.py")
+    else:
+        if applied:
+            print("[OK] Added populate_main_articles.js route to app.py")
+        else:
+            print("[SKIP] populate_main_articles.js route already in app.py")
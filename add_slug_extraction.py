@@ -1,95 +1,140 @@
 #!/usr/bin/env python3
 """Add slug extraction to multi_source_aggregator.py"""
-import re
+from patch_utils import patch_file
 
-# Read the file
-with open('multi_source_aggregator.py', 'r', encoding='utf-8') as f:
-    content = f.read()
+TARGET = 'multi_source_aggregator.py'
+
+# Slug URL prefixes and translate table built once at import time, inserted after the import block
+slug_patterns = '''
+# URL prefixes recognised by _extract_slug (plain startswith tests, no regex)
+_MIT_ARTICLE_PREFIXES = ('https://sloanreview.mit.edu/article/', 'http://sloanreview.mit.edu/article/')
+_HN_ITEM_PREFIXES = ('https://news.ycombinator.com/item?', 'http://news.ycombinator.com/item?')
+
+# ASCII-only str.translate table: keep a-z, 0-9 and '-', map whitespace to '-',
+# delete everything else. Non-ASCII titles are filtered down to ASCII first.
+_SLUG_KEEP = frozenset('abcdefghijklmnopqrstuvwxyz0123456789-')
+_SLUG_TABLE = {
+    c: (ord('-') if chr(c).isspace() else None)
+    for c in range(128) if chr(c) not in _SLUG_KEEP
+}
+
+
+def _slug_from_mit_url(url):
+    """Slug from an MIT Sloan /article/<slug>/ URL, or None"""
+    tail = url.partition('/article/')[2]
+    return tail.split('/', 1)[0] or None
+
+
+def _slug_from_hn_url(url):
+    """hn-<id> slug from a Hacker News item URL, or None"""
+    if not url.startswith(_HN_ITEM_PREFIXES):
+        return None
+    query = url.partition('?id=')[2] or url.partition('&id=')[2]
+    item_id = query.split('&', 1)[0]
+    return f"hn-{item_id}" if item_id.isdigit() else None
+
+
+# Source name -> URL slug extractor; sources not listed go straight to the title
+_SLUG_DISPATCH = {
+    'MIT Sloan': _slug_from_mit_url,
+    'Hacker News': _slug_from_hn_url,
+}
+'''
 
 # Add extract_slug helper method after _get_fallback_image
 helper_method = '''
-    def _extract_slug(self, url: str, title: str = "") -> str:
-        """Extract slug from URL or generate from title"""
-        import re
-
-        # Try to extract from MIT Sloan URL
-        if "sloanreview.mit.edu/article/" in url:
-            match = re.search(r'/article/([^/]+)/?', url)
-            if match:
-                return match.group(1)
-
-        # Try to extract from other URL patterns
-        if "hackernews" in url or "ycombinator" in url:
-            # For HN, use the ID
-            match = re.search(r'id=(\\d+)', url)
-            if match:
-                return f"hn-{match.group(1)}"
+    def _extract_slug(self, url: str, title: str = "", source: Optional[str] = None) -> str:
+        """Extract slug from URL or generate from title
+
+        When the caller knows the source, the matching URL extractor is looked
+        up directly instead of sniffing the URL for every known site.
+        """
+        if source is None:
+            # No hint: detect the site from the URL
+            if url.startswith(_MIT_ARTICLE_PREFIXES):
+                handler = _slug_from_mit_url
+            elif url.startswith(_HN_ITEM_PREFIXES):
+                handler = _slug_from_hn_url
+            else:
+                handler = None
+        else:
+            handler = _SLUG_DISPATCH.get(source)
+
+        if handler is not None:
+            slug = handler(url)
+            if slug:
+                return slug
 
         # Fallback: generate from title
         if title:
-            slug = title.lower()
-            slug = re.sub(r'[^a-z0-9\\s-]', '', slug)
-            slug = re.sub(r'\\s+', '-', slug)
-            slug = re.sub(r'^-+|-+$', '', slug)
-            return slug[:50]
+            # Only the first 50 characters survive; 80 leaves room for stripped ones
+            slug = title[:80].lower()
+            if not slug.isascii():
+                slug = ''.join(' ' if ch.isspace() else ch for ch in slug if ch.isascii() or ch.isspace())
+            slug = slug.translate(_SLUG_TABLE)
+            # Nested replaces collapse any run of up to 34 dashes to one
+            slug = slug.replace('----', '-').replace('---', '-').replace('--', '-').replace('--', '-')
+            return slug.strip('-')[:50]
 
         return "article"
 '''
 
-# Find where to insert (after _get_fallback_image method)
-insert_pos = content.find('    def extract_article_content(self, url')
-if insert_pos == -1:
-    print("ERROR: Could not find insertion point")
-    exit(1)
-
-# Insert the helper method
-content = content[:insert_pos] + helper_method + '\n\n' + content[insert_pos:]
-
-# Now update the MIT Sloan article creation to include slug
-old_append = '''                    articles.append({
-                        'title': title[:100],
-                        'excerpt': "Business strategy insights from MIT Sloan School of Management",
-                        'image': self._get_fallback_image(),
-                        'category': "Leadership",
-                        'author': "MIT Sloan Review",
-                        'date': datetime.now().strftime("%B %d, %Y"),
-                        'reading_time': random.randint(7, 12),
-                        'link': link,
-                        'source': 'MIT Sloan'
-                    })'''
-
-new_append = '''                    articles.append({
-                        'title': title[:100],
-                        'excerpt': "Business strategy insights from MIT Sloan School of Management",
-                        'image': self._get_fallback_image(),
-                        'category': "Leadership",
-                        'author': "MIT Sloan Review",
-                        'date': datetime.now().strftime("%B %d, %Y"),
-                        'reading_time': random.randint(7, 12),
-                        'link': link,
-                        'slug': self._extract_slug(link, title),
-                        'source': 'MIT Sloan'
-                    })'''
-
-content = content.replace(old_append, new_append)
-
-# Also update Hacker News articles to include slug
-hn_old = '''                'link': f"https://news.ycombinator.com/item?id={item.get('objectID', '')}",
-                'source': 'Hacker News'
-            })'''
-
-hn_new = '''                'link': f"https://news.ycombinator.com/item?id={item.get('objectID', '')}",
-                'slug': self._extract_slug(f"https://news.ycombinator.com/item?id={item.get('objectID', '')}", item.get('title', '')),
-                'source': 'Hacker News'
-            })'''
-
-content = content.replace(hn_old, hn_new)
-
-# Write the updated file
-with open('multi_source_aggregator.py', 'w', encoding='utf-8') as f:
-    f.write(content)
-
-print("[OK] Added slug extraction to multi_source_aggregator.py")
-print("   - Added _extract_slug() helper method")
-print("   - Updated MIT Sloan articles to include slug")
-print("   - Updated Hacker News articles to include slug")
+# The MIT Sloan and Hacker News article dicts are patched in place, anchored on
+# their unique 'source' entries: only the lines that change are touched.
+MIT_ANCHOR = b"'source': 'MIT Sloan'"
+HN_ANCHOR = b"'source': 'Hacker News'"
+
+# Format the date and draw every reading time once per scrape, before the article loop
+mit_today = '''            today = datetime.now().strftime("%B %d, %Y")  # same for the whole batch
+            reading_times = iter(random.choices(range(7, 13), k=len(article_elements)))
+'''
+
+mit_date = b"""'date': datetime.now().strftime("%B %d, %Y"),"""
+
+mit_slug = '''                        'slug': self._extract_slug(link, title, source='MIT Sloan'),
+'''
+
+# Build the HN URL once, on the line before the enclosing articles.append({
+hn_url = '''            hn_url = f"https://news.ycombinator.com/item?id={item.get('objectID', '')}"
+'''
+
+hn_link = b"""'link': f"https://news.ycombinator.com/item?id={item.get('objectID', '')}","""
+
+hn_slug = '''                'slug': self._extract_slug(hn_url, item.get('title', ''), source='Hacker News'),
+'''
+
+# Present once the helper exists; guards against inserting it twice
+MARKER = b"def _extract_slug("
+
+PATCHES = [
+    (b'import hashlib', slug_patterns.encode('utf-8'), "after_line"),
+    # Insert the helper after _get_fallback_image, before extract_article_content
+    (b'    def extract_article_content(self, url', (helper_method + '\n\n').encode('utf-8'), "before"),
+    # MIT Sloan: hoist date/reading times, reuse them, and add the slug entry
+    (MIT_ANCHOR, mit_today.encode('utf-8'), "before_line", b'            for '),
+    (MIT_ANCHOR, b"'date': today,", "replace", mit_date),
+    (MIT_ANCHOR, b"'reading_time': next(reading_times),", "replace", b"'reading_time': random.randint(7, 12),"),
+    (MIT_ANCHOR, mit_slug.encode('utf-8'), "before_line"),
+    # Hacker News: build the URL once and add the slug entry
+    (HN_ANCHOR, hn_url.encode('utf-8'), "before_line", b'articles.append({'),
+    (HN_ANCHOR, b"'link': hn_url,", "replace", hn_link),
+    (HN_ANCHOR, hn_slug.encode('utf-8'), "before_line"),
+]
+
+
+if __name__ == '__main__':
+    try:
+        applied = patch_file(TARGET, PATCHES, marker=MARKER)
+    except LookupError as e:
+        print(f"ERROR: {e}")
+        exit(1)
+
+    if not applied:
+        print("[SKIP] multi_source_aggregator.py already has _extract_slug()")
+        exit(0)
+
+    print("[OK] Added slug extraction to multi_source_aggregator.py")
+    print("   - Added slug URL prefixes and translate table")
+    print("   - Added _extract_slug() helper method")
+    print("   - Updated MIT Sloan articles to include slug")
+    print("   - Updated Hacker News articles to include slug")
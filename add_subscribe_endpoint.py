@@ -1,25 +1,33 @@
 """Script to add subscription endpoint to app.py"""
+from patch_utils import patch_file
 
-# Read the current app.py
-with open('app.py', 'r', encoding='utf-8') as f:
-    lines = f.readlines()
-
-# Find the line with "def health_check():"
-insert_index = None
-for i, line in enumerate(lines):
-    if 'def health_check():' in line:
-        insert_index = i
-        break
-
-if insert_index is None:
-    print("ERROR: Could not find health_check function")
-    exit(1)
+TARGET = 'app.py'
 
 # Subscription endpoint code to insert
 subscription_code = '''
 # ===== NEWSLETTER SUBSCRIPTION ENDPOINT =====
 
-@app.route('/api/subscribe', methods=['POST'])
+def _record_funnel_event(c, session_id, funnel_step, metadata):
+    """Insert a conversion_funnels row (analytics writer thread)"""
+    c.execute(\'\'\'INSERT INTO conversion_funnels (session_id, funnel_step, metadata)
+                VALUES (?, ?, ?)\'\'\', (session_id, funnel_step, metadata))
+
+
+# Process-wide storage instance, created once and shared by all requests
+_subscribers_storage = None
+_subscribers_storage_lock = threading.Lock()
+
+
+def _get_storage():
+    """Return the shared SubscribersStorage, creating it on first use"""
+    global _subscribers_storage
+    if _subscribers_storage is None:
+        with _subscribers_storage_lock:
+            if _subscribers_storage is None:
+                _subscribers_storage = SubscribersStorage()
+    return _subscribers_storage
+
+
 def subscribe():
     """Newsletter subscription endpoint with Azure Table Storage and SQLite fallback.
 
@@ -52,16 +60,8 @@ def subscribe():
         HTTP 500: Server error
     """
     try:
-        # Import subscribers storage module
-        from subscribers_storage import (
-            SubscribersStorage,
-            ValidationError,
-            DuplicateSubscriptionError,
-            SubscriptionError
-        )
-
-        # Parse request data
-        data = request.get_json()
+        # Parse request data (None for a missing or malformed JSON body)
+        data = request.get_json(silent=True, cache=False)
 
         if not data:
             return jsonify({
@@ -80,26 +80,17 @@ def subscribe():
         # Get client IP for analytics (hashed for privacy)
         ip_address = request.remote_addr
 
-        # Initialize storage and subscribe
-        storage = SubscribersStorage()
+        # Subscribe through the shared storage instance
+        storage = _get_storage()
         result = storage.subscribe(email, ip_address)
 
         # Track subscription event in analytics
         session_id = request.cookies.get('session_id')
         if session_id:
             try:
-                conn = sqlite3.connect(DB_PATH)
-                c = conn.cursor()
-                c.execute(
-                    \'\'\'INSERT INTO conversion_funnels (session_id, funnel_step, metadata)
-                    VALUES (?, ?, ?)\'\'\',
-                    (session_id, 'newsletter_subscribe', json.dumps({
-                        'email_domain': email.split('@')[1],
-                        'backend': result.storage_backend
-                    }))
-                )
-                conn.commit()
-                conn.close()
+                email_domain = email.rpartition('@')[2]
+                metadata = json.dumps({'email_domain': email_domain, 'backend': result.storage_backend})
+                queue_analytics_write(_record_funnel_event, session_id, 'newsletter_subscribe', metadata)
             except Exception as e:
                 print(f"[WARNING] Failed to track subscription event: {e}")
 
@@ -144,7 +135,6 @@ def subscribe():
             'error': 'An unexpected error occurred. Please try again later.'
         }), 500
 
-@app.route('/api/subscribers/count', methods=['GET'])
 def subscribers_count():
     """Get total subscriber count.
 
@@ -161,9 +151,7 @@ def subscribers_count():
         JSON response with subscriber count and backend information.
     """
     try:
-        from subscribers_storage import SubscribersStorage
-
-        storage = SubscribersStorage()
+        storage = _get_storage()
         stats = storage.get_subscriber_count()
 
         return jsonify({
@@ -179,14 +167,46 @@ def subscribers_count():
             'error': 'Failed to retrieve subscriber count'
         }), 500
 
+
+# subscription_routes registers the same endpoints when it can be imported;
+# these inline ones only stand in when it could not be
+if 'subscribe' not in app.view_functions:
+    app.add_url_rule('/api/subscribe', view_func=subscribe, methods=['POST'])
+    app.add_url_rule('/api/subscribers/count', view_func=subscribers_count, methods=['GET'])
+
+'''
+
+# Module-level import of the storage module (once, instead of per request).
+# Responses use app.py's jsonify (orjson provider) and funnel events its
+# batched analytics writer (queue_analytics_write).
+storage_import = '''from subscribers_storage import (
+    SubscribersStorage,
+    ValidationError,
+    DuplicateSubscriptionError,
+    SubscriptionError
+)
 '''
 
-# Insert the subscription code before health_check
-lines.insert(insert_index, subscription_code)
+# Present once the endpoint code is in app.py; guards against inserting it twice
+MARKER = b"# ===== NEWSLETTER SUBSCRIPTION ENDPOINT ====="
+
+PATCHES = [
+    (b"from flask import", storage_import.encode('utf-8'), "after_line"),
+    # Insert the subscription code before health_check and its route decorators
+    (b"def health_check():", subscription_code.encode('utf-8'), "before_line", b"@app.route('/health')"),
+]
+
+
+if __name__ == '__main__':
+    try:
+        lines = patch_file(TARGET, PATCHES, marker=MARKER, with_lines=True)
+    except LookupError:
+        print("ERROR: Could not find health_check function")
+        exit(1)
 
-# Write the updated content
-with open('app.py', 'w', encoding='utf-8') as f:
-    f.writelines(lines)
+    if not lines:
+        print("SKIP: Subscription endpoint already in app.py")
+        exit(0)
 
-print("SUCCESS: Subscription endpoint added to app.py")
-print(f"Inserted at line {insert_index}")
+    print("SUCCESS: Subscription endpoint added to app.py")
+    print(f"Inserted at line {lines[1]}")
@@ -10,16 +10,122 @@ Analyzes visitor behavior, content performance, conversion funnels, and more.
 import sys
 import os
 import sqlite3
+import io
 import json
-from datetime import datetime, timedelta
+import time
+import functools
+import contextlib
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
 from collections import defaultdict
 import argparse
 
+# orjson is optional; fall back to the stdlib json module when it is not installed
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Force UTF-8 encoding for Windows compatibility
 if sys.platform.startswith('win'):
     os.environ['PYTHONIOENCODING'] = 'utf-8'
 
+# Every scalar aggregate the report needs, as one row of per-table aggregates.
+# Each derived table is a single pass with conditional aggregates, and SQLite
+# prepares and runs one statement instead of one per metric.
+REPORT_METRICS_SQL = '''
+    SELECT * FROM
+        (SELECT COUNT(DISTINCT session_id) AS unique_visitors,
+                COUNT(*) AS total_views
+         FROM visitors
+         WHERE timestamp > :cutoff),
+        (SELECT COUNT(*) AS active_sessions
+         FROM user_sessions
+         WHERE is_active = 1),
+        (SELECT AVG(duration_seconds) AS avg_duration
+         FROM user_sessions
+         WHERE duration_seconds > 0 AND start_time > :cutoff),
+        (SELECT AVG(bounce_rate) AS bounce_rate
+         FROM user_sessions
+         WHERE start_time > :cutoff),
+        (SELECT AVG(CASE WHEN event_type = 'scroll_depth' THEN CAST(value AS INTEGER) END) AS avg_scroll,
+                AVG(CASE WHEN event_type = 'time_on_page' THEN CAST(value AS REAL) END) AS avg_time,
+                SUM(CASE WHEN event_type IN ('internal_link', 'outbound_link', 'button_click')
+                    THEN 1 ELSE 0 END) AS total_clicks
+         FROM user_events
+         WHERE event_type IN ('scroll_depth', 'time_on_page',
+                              'internal_link', 'outbound_link', 'button_click')
+         AND timestamp > :cutoff),
+        (SELECT SUM(CASE WHEN funnel_step = 'homepage' THEN 1 ELSE 0 END) AS funnel_homepage,
+                SUM(CASE WHEN funnel_step = 'article_view' THEN 1 ELSE 0 END) AS funnel_article_view,
+                SUM(CASE WHEN funnel_step = 'scroll_100' THEN 1 ELSE 0 END) AS funnel_scroll_100,
+                SUM(CASE WHEN funnel_step = 'external_click' THEN 1 ELSE 0 END) AS funnel_external_click
+         FROM conversion_funnels
+         WHERE timestamp > :cutoff)
+'''
+
+# Indexes backing the report's time-window filters, groupings and orderings
+REPORT_INDEXES = {
+    'idx_visitors_timestamp': 'visitors(timestamp)',
+    'idx_sessions_start_device': 'user_sessions(start_time, device_type)',
+    'idx_sessions_start_browser': 'user_sessions(start_time, browser)',
+    'idx_events_type_ts': 'user_events(event_type, timestamp)',
+    'idx_funnel_step_ts': 'conversion_funnels(funnel_step, timestamp)',
+    # Covering indexes: top articles are the first rows of a descending index
+    # walk, and traffic sources group by referrer straight off the index
+    'idx_pageviews_views_desc': 'page_views(view_count DESC, article_title, last_viewed)',
+    'idx_referrers_url_count': 'referrers(referrer_url, count DESC, landing_page)',
+}
+
+# Earlier report indexes that only added write cost: the hourly activity query
+# reads strftime('%H', timestamp) straight off idx_visitors_timestamp, which
+# already covers it
+RETIRED_INDEXES = ('idx_visitors_hour', 'idx_visitors_hour_ts')
+
+# Per-connection read tuning: 64 MB page cache, in-memory temp b-trees for
+# GROUP BY/ORDER BY, 256 MB of the file mapped instead of read() per page
+READ_PRAGMAS = '''
+    PRAGMA temp_store=MEMORY;
+    PRAGMA cache_size=-65536;
+    PRAGMA mmap_size=268435456;
+    PRAGMA busy_timeout=5000;
+'''
+
+
+def cutoff_timestamp(days: int) -> str:
+    """UTC timestamp N days ago, formatted like SQLite's datetime('now', '-N days')"""
+    return (datetime.now(timezone.utc) - timedelta(days=days)).strftime('%Y-%m-%d %H:%M:%S')
+
+
+# Seconds a memoized getter result stays fresh; a dashboard refresh inside
+# this window reuses it instead of re-running the query
+REPORT_CACHE_TTL = 60
+
+
+def _memoized(method):
+    """Cache a getter's result per argument tuple for REPORT_CACHE_TTL seconds"""
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        if not self.conn:
+            return method(self, *args, **kwargs)
+
+        key = (method.__name__, args, tuple(sorted(kwargs.items())))
+        now = time.monotonic()
+        hit = self._cache.get(key)
+        if hit is not None and now - hit[1] < REPORT_CACHE_TTL:
+            return hit[0]
+
+        result = method(self, *args, **kwargs)
+        self._cache[key] = (result, now)
+        return result
+
+    return wrapper
+
+
+def _truncate(text: str, width: int) -> str:
+    """Cut text to width characters, marking the cut with '...'"""
+    return text[:width] + '...' if len(text) > width else text
+
 
 class TORQAnalyzer:
     """Comprehensive analytics analyzer for TORQ Tech News"""
@@ -34,62 +140,113 @@ class TORQAnalyzer:
         self.db_path = db_path
         self.cache_path = cache_path
         self.conn = None
+        self._cache = {}
+        self._report_cutoff = None
+        self._content_cache = None
+        self._content_cache_mtime = None
 
     def connect(self):
-        """Connect to database"""
+        """Connect to database read-only, so the app's writers are never blocked
+
+        Reuses an already open connection, keeping its warm page cache.
+        """
+        if self.conn is not None:
+            return True
+
         try:
-            self.conn = sqlite3.connect(self.db_path)
-            self.conn.row_factory = sqlite3.Row
+            self.prepare_database()
+            uri = Path(self.db_path).resolve().as_uri() + '?mode=ro'
+            self.conn = sqlite3.connect(uri, uri=True)
+            self.conn.executescript(READ_PRAGMAS)
             return True
         except Exception as e:
             print(f"[ERROR] Failed to connect to database: {e}")
             return False
 
+    def prepare_database(self):
+        """Switch the database to WAL and create any missing report indexes
+
+        Uses a short-lived read-write connection; the report itself runs on
+        the read-only one opened by connect().
+        """
+        conn = sqlite3.connect(self.db_path)
+        try:
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.execute('PRAGMA synchronous=NORMAL')
+
+            c = conn.cursor()
+            c.execute("SELECT name FROM sqlite_master WHERE type = 'index'")
+            existing = {row[0] for row in c}
+            for name in RETIRED_INDEXES:
+                if name in existing:
+                    c.execute(f'DROP INDEX IF EXISTS {name}')
+            missing = [name for name in REPORT_INDEXES if name not in existing]
+            if missing:
+                # Refresh planner statistics once, when the indexes are new
+                conn.executescript(''.join(
+                    f"CREATE INDEX IF NOT EXISTS {name} ON {REPORT_INDEXES[name]};\n"
+                    for name in missing
+                ) + "ANALYZE;")
+        except sqlite3.Error as e:
+            # Missing tables or a read-only file: the queries still work, just slower
+            print(f"[WARN] Could not prepare database: {e}")
+        finally:
+            conn.close()
+
     def close(self):
         """Close database connection"""
+        self._cache.clear()
         if self.conn:
             self.conn.close()
-
-    def get_visitor_stats(self, days: int = 7) -> dict:
-        """Get visitor statistics for the past N days"""
+            self.conn = None
+
+    def __enter__(self):
+        """Connect on entering a with block; check self.conn for success"""
+        self.connect()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        """Close the connection when the with block ends"""
+        self.close()
+
+    def _cutoff(self, days: int) -> str:
+        """Window start shared by the report in progress, or a fresh one"""
+        if self._report_cutoff is not None and self._report_cutoff[0] == days:
+            return self._report_cutoff[1]
+        return cutoff_timestamp(days)
+
+    @_memoized
+    def get_report_metrics(self, days: int = 7) -> dict:
+        """Get all scalar report metrics for the past N days in one query"""
         if not self.conn:
             return {}
 
         c = self.conn.cursor()
+        c.execute(REPORT_METRICS_SQL, {'cutoff': self._cutoff(days)})
+        row = c.fetchone()
+        return {column[0]: value for column, value in zip(c.description, row)}
 
-        # Total unique visitors
-        c.execute('''SELECT COUNT(DISTINCT session_id) FROM visitors
-                    WHERE timestamp > datetime('now', '-{} days')'''.format(days))
-        unique_visitors = c.fetchone()[0] or 0
-
-        # Total page views
-        c.execute('''SELECT COUNT(*) FROM visitors
-                    WHERE timestamp > datetime('now', '-{} days')'''.format(days))
-        total_views = c.fetchone()[0] or 0
-
-        # Active sessions
-        c.execute('SELECT COUNT(*) FROM user_sessions WHERE is_active = 1')
-        active_sessions = c.fetchone()[0] or 0
+    def get_visitor_stats(self, days: int = 7, metrics: dict = None) -> dict:
+        """Get visitor statistics for the past N days"""
+        if not self.conn:
+            return {}
 
-        # Average session duration
-        c.execute('''SELECT AVG(duration_seconds) FROM user_sessions
-                    WHERE duration_seconds > 0 AND start_time > datetime('now', '-{} days')'''.format(days))
-        avg_duration = c.fetchone()[0] or 0
+        if metrics is None:
+            metrics = self.get_report_metrics(days)
 
-        # Bounce rate
-        c.execute('''SELECT AVG(bounce_rate) FROM user_sessions
-                    WHERE start_time > datetime('now', '-{} days')'''.format(days))
-        bounce_rate = c.fetchone()[0] or 0
+        avg_duration = metrics.get('avg_duration') or 0
+        bounce_rate = metrics.get('bounce_rate') or 0
 
         return {
-            'unique_visitors': unique_visitors,
-            'total_page_views': total_views,
-            'active_sessions': active_sessions,
+            'unique_visitors': metrics.get('unique_visitors') or 0,
+            'total_page_views': metrics.get('total_views') or 0,
+            'active_sessions': metrics.get('active_sessions') or 0,
             'avg_session_duration_seconds': round(avg_duration, 2),
             'bounce_rate_percentage': round(bounce_rate * 100, 2),
             'period_days': days
         }
 
+    @_memoized
     def get_top_articles(self, limit: int = 10) -> list:
         """Get top viewed articles"""
         if not self.conn:
@@ -100,16 +257,18 @@ class TORQAnalyzer:
                     FROM page_views
                     ORDER BY view_count DESC LIMIT ?''', (limit,))
 
-        articles = []
-        for row in c.fetchall():
-            articles.append({
+        articles = [
+            {
                 'title': row[0],
                 'views': row[1],
                 'last_viewed': row[2]
-            })
+            }
+            for row in c
+        ]
 
         return articles
 
+    @_memoized
     def get_traffic_sources(self, limit: int = 10) -> list:
         """Get top traffic sources (referrers)"""
         if not self.conn:
@@ -121,47 +280,46 @@ class TORQAnalyzer:
                     GROUP BY referrer_url
                     ORDER BY total DESC LIMIT ?''', (limit,))
 
-        sources = []
-        for row in c.fetchall():
-            sources.append({
+        sources = [
+            {
                 'referrer': row[0],
                 'landing_page': row[1],
                 'visits': row[2]
-            })
+            }
+            for row in c
+        ]
 
         return sources
 
+    @_memoized
     def get_device_breakdown(self, days: int = 7) -> dict:
         """Get device type breakdown"""
         if not self.conn:
             return {}
 
         c = self.conn.cursor()
-        c.execute('''SELECT device_type, COUNT(*) as count
+        c.execute('''SELECT device_type, COUNT(*) as count,
+                           COUNT(*) * 100.0 / SUM(COUNT(*)) OVER () as percentage
                     FROM user_sessions
-                    WHERE start_time > datetime('now', '-{} days')
-                    GROUP BY device_type'''.format(days))
+                    WHERE start_time > ?
+                    GROUP BY device_type''', (self._cutoff(days),))
+        rows = c.fetchall()
 
         breakdown = {'desktop': 0, 'mobile': 0, 'tablet': 0, 'unknown': 0}
-        total = 0
-
-        for row in c.fetchall():
-            device_type = row[0] or 'unknown'
-            count = row[1]
-            breakdown[device_type] = count
-            total += count
-
-        # Calculate percentages
-        if total > 0:
-            for device in breakdown:
-                percentage = (breakdown[device] / total) * 100
-                breakdown[device] = {
-                    'count': breakdown[device],
-                    'percentage': round(percentage, 2)
-                }
+        if not rows:
+            return breakdown
+
+        # Percentages come from the window sum; devices with no sessions show 0%
+        breakdown = {device: {'count': 0, 'percentage': 0.0} for device in breakdown}
+        for device_type, count, percentage in rows:
+            breakdown[device_type or 'unknown'] = {
+                'count': count,
+                'percentage': round(percentage, 2)
+            }
 
         return breakdown
 
+    @_memoized
     def get_browser_breakdown(self, days: int = 7, limit: int = 10) -> list:
         """Get browser breakdown"""
         if not self.conn:
@@ -170,34 +328,32 @@ class TORQAnalyzer:
         c = self.conn.cursor()
         c.execute('''SELECT browser, COUNT(*) as count
                     FROM user_sessions
-                    WHERE start_time > datetime('now', '-{} days')
+                    WHERE start_time > ?
                     GROUP BY browser
-                    ORDER BY count DESC LIMIT ?'''.format(days), (limit,))
+                    ORDER BY count DESC LIMIT ?''', (self._cutoff(days), limit))
 
-        browsers = []
-        for row in c.fetchall():
-            browsers.append({
+        browsers = [
+            {
                 'browser': row[0],
                 'sessions': row[1]
-            })
+            }
+            for row in c
+        ]
 
         return browsers
 
-    def get_conversion_funnel(self, days: int = 7) -> dict:
+    def get_conversion_funnel(self, days: int = 7, metrics: dict = None) -> dict:
         """Analyze conversion funnel"""
         if not self.conn:
             return {}
 
-        c = self.conn.cursor()
-        c.execute('''SELECT funnel_step, COUNT(*) as count
-                    FROM conversion_funnels
-                    WHERE timestamp > datetime('now', '-{} days')
-                    GROUP BY funnel_step
-                    ORDER BY count DESC'''.format(days))
+        if metrics is None:
+            metrics = self.get_report_metrics(days)
 
-        funnel = {}
-        for row in c.fetchall():
-            funnel[row[0]] = row[1]
+        funnel = {
+            step: metrics.get('funnel_' + step) or 0
+            for step in ('homepage', 'article_view', 'scroll_100', 'external_click')
+        }
 
         # Calculate conversion rates
         homepage_visits = funnel.get('homepage', 0)
@@ -228,6 +384,7 @@ class TORQAnalyzer:
 
         return funnel_analysis
 
+    @_memoized
     def get_hourly_activity(self, days: int = 7) -> list:
         """Get hourly activity pattern"""
         if not self.conn:
@@ -236,100 +393,115 @@ class TORQAnalyzer:
         c = self.conn.cursor()
         c.execute('''SELECT strftime('%H', timestamp) as hour, COUNT(*) as count
                     FROM visitors
-                    WHERE timestamp > datetime('now', '-{} days')
+                    WHERE timestamp > ?
                     GROUP BY hour
-                    ORDER BY hour'''.format(days))
+                    ORDER BY hour''', (self._cutoff(days),))
 
-        activity = []
-        for row in c.fetchall():
-            activity.append({
+        activity = [
+            {
                 'hour': int(row[0]),
                 'visits': row[1]
-            })
+            }
+            for row in c
+        ]
 
         return activity
 
-    def get_user_engagement(self, days: int = 7) -> dict:
+    def get_user_engagement(self, days: int = 7, metrics: dict = None) -> dict:
         """Get user engagement metrics"""
         if not self.conn:
             return {}
 
-        c = self.conn.cursor()
+        if metrics is None:
+            metrics = self.get_report_metrics(days)
 
-        # Average scroll depth
-        c.execute('''SELECT AVG(CAST(value AS INTEGER)) as avg_depth
-                    FROM user_events
-                    WHERE event_type = 'scroll_depth'
-                    AND timestamp > datetime('now', '-{} days')'''.format(days))
-        avg_scroll = c.fetchone()[0] or 0
-
-        # Average time on page
-        c.execute('''SELECT AVG(CAST(value AS REAL)) as avg_time
-                    FROM user_events
-                    WHERE event_type = 'time_on_page'
-                    AND timestamp > datetime('now', '-{} days')'''.format(days))
-        avg_time = c.fetchone()[0] or 0
-
-        # Total clicks (internal + external)
-        c.execute('''SELECT COUNT(*) FROM user_events
-                    WHERE event_type IN ('internal_link', 'outbound_link', 'button_click')
-                    AND timestamp > datetime('now', '-{} days')'''.format(days))
-        total_clicks = c.fetchone()[0] or 0
+        avg_scroll = metrics.get('avg_scroll') or 0
+        avg_time = metrics.get('avg_time') or 0
 
         return {
             'avg_scroll_depth_percent': round(avg_scroll, 2),
             'avg_time_on_page_seconds': round(avg_time, 2),
-            'total_clicks': total_clicks
+            'total_clicks': metrics.get('total_clicks') or 0
         }
 
     def get_content_stats(self) -> dict:
-        """Get content statistics from data cache"""
+        """Get content statistics from data cache, re-parsed only when the file changes"""
         try:
-            with open(self.cache_path, 'r', encoding='utf-8') as f:
-                cache = json.load(f)
+            mtime = os.stat(self.cache_path).st_mtime_ns
+            if mtime == self._content_cache_mtime:
+                return self._content_cache
+
+            raw = Path(self.cache_path).read_bytes()
+            cache = orjson.loads(raw) if orjson is not None else json.loads(raw)
 
             articles = cache.get('articles', [])
             featured = cache.get('featured', {})
             sources = cache.get('sources_used', [])
             last_update = cache.get('timestamp', 'Unknown')
 
-            # Count articles with full text
-            full_text_count = sum(1 for a in articles if a.get('full_text'))
+            # Count articles with full text and collect categories in one pass;
+            # a dict keeps the first-seen order, which a set would not
+            full_text_count = 0
+            categories = {}
+            for a in articles:
+                if a.get('full_text'):
+                    full_text_count += 1
+                categories.setdefault(a.get('category', 'Unknown'), None)
 
-            return {
+            self._content_cache = {
                 'total_articles': len(articles),
                 'articles_with_full_text': full_text_count,
                 'featured_article': featured.get('title', 'N/A'),
                 'sources_used': sources,
                 'last_update': last_update,
-                'categories': list(set(a.get('category', 'Unknown') for a in articles))
+                'categories': list(categories)
             }
+            self._content_cache_mtime = mtime
+            return self._content_cache
         except Exception as e:
             print(f"[WARN] Could not read content cache: {e}")
             return {}
 
+    @_memoized
     def get_recent_activity(self, limit: int = 20) -> list:
         """Get recent visitor activity"""
         if not self.conn:
             return []
 
         c = self.conn.cursor()
-        c.execute('''SELECT page_url, timestamp, session_id
+        # Seconds precision and an 8-character session prefix (for privacy)
+        # are cut in SQL, so only the displayed text crosses into Python
+        c.execute('''SELECT page_url, substr(timestamp, 1, 19), substr(session_id, 1, 8) || '...'
                     FROM visitors
                     ORDER BY timestamp DESC LIMIT ?''', (limit,))
 
-        activity = []
-        for row in c.fetchall():
-            activity.append({
+        activity = [
+            {
                 'page': row[0],
                 'timestamp': row[1],
-                'session': row[2][:8] + '...'  # Truncate for privacy
-            })
+                'session': row[2]
+            }
+            for row in c
+        ]
 
         return activity
 
     def generate_report(self, days: int = 7, detailed: bool = True) -> dict:
         """Generate comprehensive analytics report"""
+        # Every section filters on the same window start, computed once
+        self._report_cutoff = (days, cutoff_timestamp(days))
+        # Collect the ~100 section lines and write them to the console at once
+        buf = io.StringIO()
+        try:
+            with contextlib.redirect_stdout(buf):
+                return self._build_report(days, detailed)
+        finally:
+            self._report_cutoff = None
+            sys.stdout.write(buf.getvalue())
+            sys.stdout.flush()
+
+    def _build_report(self, days: int, detailed: bool) -> dict:
+        """Print each report section and collect it into the report dict"""
         print("="*70)
         print(f"TORQ Tech News - Analytics Report (Last {days} Days)")
         print("="*70)
@@ -340,10 +512,13 @@ class TORQAnalyzer:
             'period_days': days
         }
 
+        # Visitor, funnel and engagement figures all come from one round-trip
+        metrics = self.get_report_metrics(days)
+
         # Visitor Statistics
         print("[1] VISITOR STATISTICS")
         print("-" * 70)
-        visitor_stats = self.get_visitor_stats(days)
+        visitor_stats = self.get_visitor_stats(days, metrics)
         report['visitor_stats'] = visitor_stats
 
         print(f"  Unique Visitors:       {visitor_stats['unique_visitors']:,}")
@@ -360,9 +535,10 @@ class TORQAnalyzer:
         report['top_articles'] = top_articles
 
         if top_articles:
-            for i, article in enumerate(top_articles, 1):
-                title = article['title'][:60] + '...' if len(article['title']) > 60 else article['title']
-                print(f"  {i:2d}. {title:<63} {article['views']:>4} views")
+            print('\n'.join(
+                f"  {i:2d}. {_truncate(article['title'], 60):<63} {article['views']:>4} views"
+                for i, article in enumerate(top_articles, 1)
+            ))
         else:
             print("  No article data available yet.")
         print()
@@ -374,9 +550,10 @@ class TORQAnalyzer:
         report['traffic_sources'] = traffic_sources
 
         if traffic_sources:
-            for i, source in enumerate(traffic_sources, 1):
-                referrer = source['referrer'][:50] + '...' if len(source['referrer']) > 50 else source['referrer']
-                print(f"  {i:2d}. {referrer:<53} {source['visits']:>4} visits")
+            print('\n'.join(
+                f"  {i:2d}. {_truncate(source['referrer'], 50):<53} {source['visits']:>4} visits"
+                for i, source in enumerate(traffic_sources, 1)
+            ))
         else:
             print("  No referrer data available yet.")
         print()
@@ -399,9 +576,10 @@ class TORQAnalyzer:
         report['browser_breakdown'] = browser_breakdown
 
         if browser_breakdown:
-            for i, browser in enumerate(browser_breakdown, 1):
-                browser_name = browser['browser'][:50] + '...' if len(browser['browser']) > 50 else browser['browser']
-                print(f"  {i:2d}. {browser_name:<53} {browser['sessions']:>4} sessions")
+            print('\n'.join(
+                f"  {i:2d}. {_truncate(browser['browser'], 50):<53} {browser['sessions']:>4} sessions"
+                for i, browser in enumerate(browser_breakdown, 1)
+            ))
         else:
             print("  No browser data available yet.")
         print()
@@ -409,7 +587,7 @@ class TORQAnalyzer:
         # Conversion Funnel
         print("[6] CONVERSION FUNNEL ANALYSIS")
         print("-" * 70)
-        funnel = self.get_conversion_funnel(days)
+        funnel = self.get_conversion_funnel(days, metrics)
         report['conversion_funnel'] = funnel
 
         print(f"  Homepage Visits:                {funnel['homepage_visits']:,}")
@@ -425,7 +603,7 @@ class TORQAnalyzer:
         # User Engagement
         print("[7] USER ENGAGEMENT METRICS")
         print("-" * 70)
-        engagement = self.get_user_engagement(days)
+        engagement = self.get_user_engagement(days, metrics)
         report['user_engagement'] = engagement
 
         print(f"  Avg Scroll Depth:      {engagement['avg_scroll_depth_percent']:.1f}%")
@@ -458,14 +636,12 @@ class TORQAnalyzer:
             report['hourly_activity'] = hourly_activity
 
             if hourly_activity:
-                # Create simple bar chart
-                max_visits = max(h['visits'] for h in hourly_activity) if hourly_activity else 1
-                for activity in hourly_activity:
-                    hour = activity['hour']
-                    visits = activity['visits']
-                    bar_length = int((visits / max_visits) * 40) if max_visits > 0 else 0
-                    bar = '█' * bar_length
-                    print(f"  {hour:02d}:00  {bar:<40} {visits:>4}")
+                # Create simple bar chart, written as one block
+                max_visits = max(h['visits'] for h in hourly_activity) or 1
+                print('\n'.join(
+                    f"  {h['hour']:02d}:00  {'█' * int(h['visits'] / max_visits * 40):<40} {h['visits']:>4}"
+                    for h in hourly_activity
+                ))
             else:
                 print("  No hourly activity data available yet.")
             print()
@@ -478,7 +654,7 @@ class TORQAnalyzer:
 
             if recent:
                 for activity in recent:
-                    timestamp = activity['timestamp'][:19]  # Trim milliseconds
+                    timestamp = activity['timestamp']
                     page = activity['page'][:30] + '...' if len(activity['page']) > 30 else activity['page']
                     print(f"  {timestamp}  {page:<33} [{activity['session']}]")
             else:
@@ -494,6 +670,8 @@ class TORQAnalyzer:
 
     def export_report(self, output_file: str, days: int = 7):
         """Export report to JSON file"""
+        # Only close a connection this call opened itself
+        owns_connection = self.conn is None
         if not self.connect():
             print("[ERROR] Could not connect to database")
             return False
@@ -501,8 +679,11 @@ class TORQAnalyzer:
         try:
             report = self.generate_report(days, detailed=True)
 
-            with open(output_file, 'w', encoding='utf-8') as f:
-                json.dump(report, f, indent=2, ensure_ascii=False)
+            if orjson is not None:
+                Path(output_file).write_bytes(orjson.dumps(report, option=orjson.OPT_INDENT_2))
+            else:
+                with open(output_file, 'w', encoding='utf-8') as f:
+                    json.dump(report, f, indent=2, ensure_ascii=False)
 
             print(f"[SUCCESS] Report exported to: {output_file}")
             return True
@@ -511,7 +692,8 @@ class TORQAnalyzer:
             print(f"[ERROR] Failed to export report: {e}")
             return False
         finally:
-            self.close()
+            if owns_connection:
+                self.close()
 
 
 def main():
@@ -558,28 +740,26 @@ Examples:
         print("  python app.py")
         return 1
 
-    # Connect to database
-    if not analyzer.connect():
-        return 1
+    # Connect to database; the one connection serves every report below
+    with analyzer:
+        if analyzer.conn is None:
+            return 1
 
-    try:
-        if args.export:
-            # Export mode
-            analyzer.export_report(args.export, args.days)
-        else:
-            # Console report mode
-            analyzer.generate_report(args.days, detailed=not args.simple)
+        try:
+            if args.export:
+                # Export mode
+                analyzer.export_report(args.export, args.days)
+            else:
+                # Console report mode
+                analyzer.generate_report(args.days, detailed=not args.simple)
 
-        return 0
+            return 0
 
-    except Exception as e:
-        print(f"[ERROR] Analysis failed: {e}")
-        import traceback
-        traceback.print_exc()
-        return 1
-
-    finally:
-        analyzer.close()
+        except Exception as e:
+            print(f"[ERROR] Analysis failed: {e}")
+            import traceback
+            traceback.print_exc()
+            return 1
 
 
 if __name__ == '__main__':
@@ -7,29 +7,80 @@ Complete website with visitor tracking, dynamic content, automation, and advance
 
 import sys
 import os
+import logging
 
 # Force UTF-8 encoding for Windows compatibility
 if sys.platform.startswith('win'):
     os.environ['PYTHONIOENCODING'] = 'utf-8'
 
-from flask import Flask, render_template, jsonify, request, send_from_directory
+from flask import Flask, render_template, jsonify, request, send_from_directory, g
+from flask.json.provider import DefaultJSONProvider
 from datetime import datetime, timedelta
 import json
-import random
 import threading
 import time
 import sqlite3
+import queue
+import atexit
+import signal
+import bisect
+import functools
 from pathlib import Path
 import hashlib
+import tempfile
+import zlib
 import html
-import unicodedata
-import re
 from user_agents import parse
+from markupsafe import Markup
+from jinja2.utils import htmlsafe_json_dumps
+
+# orjson is optional; fall back to the stdlib json module when it is not installed
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# fcntl is POSIX-only; without it the updater is only guarded within the process
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
 
 app = Flask(__name__,
            static_folder='.',
            template_folder='.')
 
+logger = logging.getLogger(__name__)
+
+
+class OrjsonProvider(DefaultJSONProvider):
+    """Flask JSON provider that serializes with orjson
+
+    Keys are sorted like the default provider, and dates and other types
+    orjson does not handle go through the default provider's fallback.
+    """
+
+    OPTIONS = (orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME) if orjson else 0
+
+    def dumps(self, obj, **kwargs):
+        if kwargs:
+            return super().dumps(obj, **kwargs)
+        return orjson.dumps(obj, default=self.default, option=self.OPTIONS).decode('utf-8')
+
+    def loads(self, s, **kwargs):
+        if kwargs:
+            return super().loads(s, **kwargs)
+        return orjson.loads(s)
+
+    def response(self, *args, **kwargs):
+        obj = self._prepare_response_obj(args, kwargs)
+        body = orjson.dumps(obj, default=self.default, option=self.OPTIONS | orjson.OPT_APPEND_NEWLINE)
+        return self._app.response_class(body, mimetype=self.mimetype)
+
+
+if orjson is not None:
+    app.json = OrjsonProvider(app)
+
 # Database setup
 # Use relative path for cross-platform compatibility
 import os
@@ -37,11 +88,22 @@ DB_DIR = os.path.dirname(os.path.abspath(__file__))
 DB_PATH = os.path.join(DB_DIR, "analytics.db")
 DATA_CACHE_PATH = os.path.join(DB_DIR, "data_cache.json")
 
+# Article page stylesheet; its content hash versions the URL so browsers can
+# cache it for a year and still pick up edits immediately
+ARTICLE_CSS_PATH = os.path.join(DB_DIR, "article-detail.css")
+with open(ARTICLE_CSS_PATH, 'rb') as f:
+    ARTICLE_CSS_VERSION = hashlib.blake2b(f.read(), digest_size=4).hexdigest()
+
 def init_db():
     """Initialize database for analytics and content with advanced tracking"""
     conn = sqlite3.connect(DB_PATH)
     c = conn.cursor()
 
+    # WAL is stored in the database file, so every later connection uses it:
+    # readers no longer block on the visitor writes, and commits fsync once
+    c.execute('PRAGMA journal_mode=WAL')
+    c.execute('PRAGMA synchronous=NORMAL')
+
     # Visitors table (existing)
     c.execute('''CREATE TABLE IF NOT EXISTS visitors (
         id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -142,9 +204,29 @@ def init_db():
         FOREIGN KEY (session_id) REFERENCES user_sessions(session_id)
     )''')
 
+    # Small key/value table for counters maintained by triggers
+    c.execute('''CREATE TABLE IF NOT EXISTS meta (
+        key TEXT PRIMARY KEY,
+        value INTEGER NOT NULL DEFAULT 0
+    )''')
+
+    # Total page views kept as a counter: COUNT(*) over all of visitors has no
+    # shortcut in SQLite and walks the whole table
+    c.execute('''CREATE TRIGGER IF NOT EXISTS trg_visitors_count_insert AFTER INSERT ON visitors
+                BEGIN UPDATE meta SET value = value + 1 WHERE key = 'total_views'; END''')
+    c.execute('''CREATE TRIGGER IF NOT EXISTS trg_visitors_count_delete AFTER DELETE ON visitors
+                BEGIN UPDATE meta SET value = value - 1 WHERE key = 'total_views'; END''')
+    c.execute('''INSERT OR IGNORE INTO meta (key, value)
+                VALUES ('total_views', (SELECT COUNT(*) FROM visitors))''')
+
     # Create indexes for performance
-    c.execute('CREATE INDEX IF NOT EXISTS idx_visitors_session ON visitors(session_id)')
     c.execute('CREATE INDEX IF NOT EXISTS idx_visitors_timestamp ON visitors(timestamp)')
+    c.execute('CREATE INDEX IF NOT EXISTS idx_visitors_session_ts ON visitors(session_id, timestamp)')
+    # session_id is the prefix of idx_visitors_session_ts, so the old
+    # session_id-only index answers nothing that one does not, and costs one
+    # more b-tree write per tracked visit
+    c.execute('DROP INDEX IF EXISTS idx_visitors_session')
+    c.execute('CREATE INDEX IF NOT EXISTS idx_pageviews_views ON page_views(view_count DESC)')
     c.execute('CREATE INDEX IF NOT EXISTS idx_sessions_start_time ON user_sessions(start_time)')
     c.execute('CREATE INDEX IF NOT EXISTS idx_events_session ON user_events(session_id)')
     c.execute('CREATE INDEX IF NOT EXISTS idx_events_type ON user_events(event_type)')
@@ -152,6 +234,33 @@ def init_db():
     c.execute('CREATE INDEX IF NOT EXISTS idx_funnels_session ON conversion_funnels(session_id)')
     c.execute('CREATE INDEX IF NOT EXISTS idx_funnels_step ON conversion_funnels(funnel_step)')
 
+    # page_views is upserted on article_id, which needs a unique index. Fold any
+    # duplicate rows left by the old select-then-insert tracking into one first.
+    c.execute("SELECT 1 FROM sqlite_master WHERE type='index' AND name='idx_page_views_article'")
+    if not c.fetchone():
+        c.execute('''UPDATE page_views SET view_count = (
+                        SELECT SUM(p.view_count) FROM page_views p WHERE p.article_id = page_views.article_id)
+                    WHERE id IN (SELECT MIN(id) FROM page_views GROUP BY article_id HAVING COUNT(*) > 1)''')
+        c.execute('''DELETE FROM page_views
+                    WHERE id NOT IN (SELECT MIN(id) FROM page_views GROUP BY article_id)''')
+        c.execute('CREATE UNIQUE INDEX idx_page_views_article ON page_views(article_id)')
+
+    # Same for referrers, upserted on (referrer_url, landing_page)
+    c.execute("SELECT 1 FROM sqlite_master WHERE type='index' AND name='idx_referrers_url_landing'")
+    if not c.fetchone():
+        c.execute('''UPDATE referrers SET
+                        count = (SELECT SUM(r.count) FROM referrers r
+                                 WHERE r.referrer_url IS referrers.referrer_url
+                                   AND r.landing_page IS referrers.landing_page),
+                        last_seen = (SELECT MAX(r.last_seen) FROM referrers r
+                                     WHERE r.referrer_url IS referrers.referrer_url
+                                       AND r.landing_page IS referrers.landing_page)
+                    WHERE id IN (SELECT MIN(id) FROM referrers
+                                 GROUP BY referrer_url, landing_page HAVING COUNT(*) > 1)''')
+        c.execute('''DELETE FROM referrers
+                    WHERE id NOT IN (SELECT MIN(id) FROM referrers GROUP BY referrer_url, landing_page)''')
+        c.execute('CREATE UNIQUE INDEX idx_referrers_url_landing ON referrers(referrer_url, landing_page)')
+
     conn.commit()
     conn.close()
     print("[DB] Database initialized successfully with advanced analytics")
@@ -217,29 +326,113 @@ def init_data_cache():
                 }
             ]
         }
-        with open(DATA_CACHE_PATH, 'w', encoding='utf-8') as f:
-            json.dump(default_data, f, indent=2, ensure_ascii=False)
+        if orjson is not None:
+            with open(DATA_CACHE_PATH, 'wb') as f:
+                f.write(orjson.dumps(default_data, option=orjson.OPT_INDENT_2))
+        else:
+            with open(DATA_CACHE_PATH, 'w', encoding='utf-8') as f:
+                json.dump(default_data, f, indent=2, ensure_ascii=False)
         print("[CACHE] Default data cache created successfully")
     else:
         print("[CACHE] data_cache.json found")
 
-# Initialize database and data cache on startup
-init_db()
-migrate_db()
-init_data_cache()
+# Parsed data_cache.json shared by all requests. It is re-read only when the
+# file's mtime or size changes, and the whole state is swapped in one assignment.
+_data_cache = {'stamp': None, 'data': None, 'by_slug': {}, 'slug_prefix': []}
+_data_cache_lock = threading.Lock()
+
+def load_data_cache():
+    """Return the current data cache state, re-parsing the file only when it changes"""
+    global _data_cache
+    st = os.stat(DATA_CACHE_PATH)
+    stamp = (st.st_mtime_ns, st.st_size)
+    state = _data_cache
+    if state['stamp'] != stamp:
+        with _data_cache_lock:
+            state = _data_cache
+            if state['stamp'] != stamp:
+                with open(DATA_CACHE_PATH, 'rb') as f:
+                    raw = f.read()
+                data = orjson.loads(raw) if orjson is not None else json.loads(raw)
+
+                # Slug -> article for O(1) article lookups; first match wins as before
+                by_slug = {}
+                for a in data.get('articles', []):
+                    if a.get('slug'):
+                        by_slug.setdefault(a['slug'], a)
+
+                # (slug, position) pairs sorted by slug, for bisecting prefix matches
+                slug_prefix = sorted(
+                    (a.get('slug', ''), i) for i, a in enumerate(data.get('articles', []))
+                )
+
+                state = {'stamp': stamp, 'data': data, 'by_slug': by_slug, 'slug_prefix': slug_prefix}
+                _data_cache = state
+    return state
+
+def get_cache():
+    """Return the parsed data_cache.json"""
+    return load_data_cache()['data']
+
+# Database and data cache setup runs once per process, on the first request,
+# so importing the module (tests, scripts, a preloading WSGI master) stays cheap
+_initialized = False
+_init_lock = threading.Lock()
+
+@app.before_request
+def ensure_initialized():
+    """Initialize the database and data cache if this process has not yet"""
+    global _initialized
+    if _initialized:
+        return
+    with _init_lock:
+        if not _initialized:
+            init_db()
+            migrate_db()
+            init_data_cache()
+            _initialized = True
 
-# Register newsletter subscription routes
-try:
-    from subscription_routes import register_subscription_routes
-    register_subscription_routes(app)
-    print("[INFO] Newsletter subscription routes registered")
-except ImportError as e:
-    print(f"[WARNING] Failed to load subscription routes: {e}")
-    print(f"[WARNING] Make sure subscription_routes.py exists in the project directory")
-except Exception as e:
-    print(f"[ERROR] Error registering subscription routes: {e}")
+# Page markup around a generated article. The paragraph slots are filled once
+# per template (see _article_page_format); {category} is left for each article.
+ARTICLE_PAGE_SHELL = """
+        <div class="article-full-content">
+            <p class="lead-paragraph">{intro}</p>
 
-# Content generator for full articles
+            <h3>Key Findings</h3>
+            {key_findings}
+
+            <h3>Practical Implications</h3>
+            {implications}
+
+            <h3>Conclusion</h3>
+            <p>{conclusion}</p>
+
+            <div class="key-takeaways">
+                <h4>Key Takeaways</h4>
+                <ul>
+                    <li>Organizations must develop systematic approaches to {{category}}</li>
+                    <li>Success requires alignment across technology, processes, and people</li>
+                    <li>Long-term commitment and adaptability are essential</li>
+                    <li>Measuring results and learning from failures drives improvement</li>
+                </ul>
+            </div>
+        </div>
+        """
+
+def _article_page_format(template):
+    """Join one article template into a page format string taking topic, focus_area and category"""
+    body = template["body"]
+    return ARTICLE_PAGE_SHELL.format(
+        intro=template["intro"],
+        key_findings="".join(f'<p>{p}</p>' for p in body[:3]),
+        implications="".join(f'<p>{p}</p>' for p in body[3:]),
+        conclusion=template["conclusion"]
+    )
+
+# Content generator for full articles. Generation is str.format over pre-joined
+# templates plus an lru_cache; a JIT (Numba, Cython) has nothing to compile
+# here, since the work is already C-level str ops. Numba is only worth it for
+# numeric loops, e.g. if article similarity scoring is ever added.
 class ContentGenerator:
     """Generates full article content"""
 
@@ -268,6 +461,9 @@ class ContentGenerator:
         }
     ]
 
+    # Each template pre-joined into its full page, so generating an article is one .format call
+    ARTICLE_PAGES = [_article_page_format(t) for t in ARTICLE_TEMPLATES]
+
     TOPICS = {
         "AI Strategy": {
             "focus": "artificial intelligence integration",
@@ -296,56 +492,43 @@ class ContentGenerator:
     }
 
     @classmethod
+    @functools.lru_cache(maxsize=512)
     def generate_full_article(cls, title, category):
-        """Generate complete article with multiple paragraphs"""
-        template = random.choice(cls.ARTICLE_TEMPLATES)
+        """Generate complete article with multiple paragraphs
+
+        The template is picked from a stable hash of (title, category), so the
+        result is a pure function of its arguments: every worker process
+        renders the same body for an article, and the cache can keep it.
+        """
+        key = zlib.crc32(f"{title}\0{category}".encode('utf-8'))
+        page = cls.ARTICLE_PAGES[key % len(cls.ARTICLE_PAGES)]
 
         # Determine topic and focus area
         topic = title.split(':')[0] if ':' in title else title
         topic_data = cls.TOPICS.get(category, cls.TOPICS["Strategy"])
-        focus_area = topic_data["focus"]
-
-        # Generate content
-        intro = template["intro"].format(topic=topic, focus_area=focus_area)
-        body_paragraphs = [p.format(topic=topic, focus_area=focus_area) for p in template["body"]]
-        conclusion = template["conclusion"].format(topic=topic, focus_area=focus_area)
-
-        # Combine into HTML
-        html_content = f"""
-        <div class="article-full-content">
-            <p class="lead-paragraph">{intro}</p>
-
-            <h3>Key Findings</h3>
-            {"".join(f'<p>{p}</p>' for p in body_paragraphs[:3])}
-
-            <h3>Practical Implications</h3>
-            {"".join(f'<p>{p}</p>' for p in body_paragraphs[3:])}
-
-            <h3>Conclusion</h3>
-            <p>{conclusion}</p>
 
-            <div class="key-takeaways">
-                <h4>Key Takeaways</h4>
-                <ul>
-                    <li>Organizations must develop systematic approaches to {category.lower()}</li>
-                    <li>Success requires alignment across technology, processes, and people</li>
-                    <li>Long-term commitment and adaptability are essential</li>
-                    <li>Measuring results and learning from failures drives improvement</li>
-                </ul>
-            </div>
-        </div>
-        """
+        return page.format(
+            topic=html.escape(topic),
+            focus_area=topic_data["focus"],
+            category=html.escape(category.lower())
+        )
 
-        return html_content
+# ASCII str.translate table for normalize_slug: keeps a-z, 0-9, '-' and
+# whitespace, deletes every other ASCII character in the same C-level pass.
+# Numba/Cython would not help: nopython mode does not handle these str
+# methods well, and the per-call dispatch would cost more than the function.
+_SLUG_KEEP = frozenset('abcdefghijklmnopqrstuvwxyz0123456789-')
+_SLUG_TABLE = {c: None for c in range(128) if chr(c) not in _SLUG_KEEP and not chr(c).isspace()}
 
+@functools.lru_cache(maxsize=4096)
 def normalize_slug(title):
     """Normalize title to slug format (same as JavaScript)"""
-    import re
-    slug = title.lower()
-    slug = re.sub(r'[^a-z0-9\s-]', '', slug)  # Remove non-alphanumeric except spaces and dashes
-    slug = re.sub(r'\s+', '-', slug)  # Replace spaces with dashes
-    slug = re.sub(r'^-+|-+$', '', slug)  # Remove leading/trailing dashes
-    return slug[:50]  # Limit to 50 characters
+    slug = title.lower().translate(_SLUG_TABLE)  # Remove non-alphanumeric except spaces and dashes
+    if not slug.isascii():
+        # Non-ASCII letters are removed too; Unicode whitespace still separates words
+        slug = ''.join(ch for ch in slug if ch.isascii() or ch.isspace())
+    slug = '-'.join(slug.split())  # Replace each run of spaces with one dash
+    return slug.strip('-')[:50]  # Remove leading/trailing dashes, limit to 50 characters
 
 def parse_user_agent(ua_string):
     """Parse user agent string to extract device info"""
@@ -363,108 +546,291 @@ def parse_user_agent(ua_string):
             'os': 'unknown'
         }
 
+# Idle request connections, kept open (with their PRAGMAs and page cache) for
+# the next request instead of a connect/close each time. At most DB_POOL_SIZE
+# are kept; a request that finds the pool empty opens a fresh one.
+DB_POOL_SIZE = 8
+_db_pool = queue.LifoQueue(maxsize=DB_POOL_SIZE)
+
+def get_conn():
+    """Return the current request's database connection, taking it from the pool on first use
+
+    The connection lives on flask.g and goes back to the pool in release_conn
+    when the app context ends. It is deliberately not cached per thread:
+    gunicorn runs gevent workers, whose monkey-patching turns threading.local
+    into greenlet-local storage, so a per-thread cache would open a connection
+    for every request greenlet and never close it. Pooled connections move
+    between threads (or greenlets), but only one request uses each at a time.
+    """
+    held = g.get('db_conn')
+    if held is None:
+        try:
+            held = _db_pool.get_nowait()
+        except queue.Empty:
+            held = None
+        if held is not None and held[0] != DB_PATH:
+            held[1].close()
+            held = None
+        if held is None:
+            conn = sqlite3.connect(DB_PATH, check_same_thread=False)
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.execute('PRAGMA synchronous=NORMAL')
+            conn.execute('PRAGMA temp_store=MEMORY')
+            conn.execute('PRAGMA cache_size=-65536')  # 64 MB page cache
+            conn.execute('PRAGMA mmap_size=268435456')
+            held = (DB_PATH, conn)
+        g.db_conn = held
+    return held[1]
+
+@app.teardown_appcontext
+def release_conn(exc):
+    """Return the request's database connection to the pool, or close it when the pool is full"""
+    held = g.pop('db_conn', None)
+    if held is None:
+        return
+    if held[1].in_transaction:
+        held[1].rollback()
+    try:
+        _db_pool.put_nowait(held)
+    except queue.Full:
+        held[1].close()
+
+# ===== BATCHED ANALYTICS WRITER =====
+
+# Tracking writes are queued by the request handlers and committed by a single
+# background thread, one transaction (and one fsync) per batch instead of per request
+ANALYTICS_BATCH_SIZE = 500
+ANALYTICS_FLUSH_INTERVAL = 1.0  # seconds a batch may wait for more writes
+_analytics_queue = queue.Queue()
+_analytics_writer = None
+_analytics_writer_lock = threading.Lock()
+
+def _write_analytics_batches():
+    """Drain the analytics queue, committing up to ANALYTICS_BATCH_SIZE writes per transaction
+
+    Each queued item is a (write, args) pair; write(cursor, *args) runs inside
+    the batch transaction. After the first write of a batch arrives, the writer
+    keeps collecting for up to ANALYTICS_FLUSH_INTERVAL, so steady moderate
+    traffic still shares commits. A None item flushes what is pending and
+    stops the writer.
+    """
+    conn = sqlite3.connect(DB_PATH, check_same_thread=False, isolation_level=None)
+    conn.execute('PRAGMA journal_mode=WAL')
+    conn.execute('PRAGMA synchronous=NORMAL')
+    conn.execute('PRAGMA temp_store=MEMORY')
+    conn.execute('PRAGMA mmap_size=268435456')
+    c = conn.cursor()
+
+    running = True
+    while running:
+        batch = []
+        item = _analytics_queue.get()
+        deadline = time.monotonic() + ANALYTICS_FLUSH_INTERVAL
+        while item is not None:
+            batch.append(item)
+            if len(batch) >= ANALYTICS_BATCH_SIZE:
+                break
+            remaining = deadline - time.monotonic()
+            try:
+                item = _analytics_queue.get(timeout=remaining) if remaining > 0 else _analytics_queue.get_nowait()
+            except queue.Empty:
+                break
+        else:
+            running = False
+
+        if not batch:
+            continue
+        try:
+            c.execute('BEGIN IMMEDIATE')
+            for write, args in batch:
+                # A failed statement leaves the rest of the batch intact
+                try:
+                    write(c, *args)
+                except Exception as e:
+                    print(f"[ERROR] Tracking error: {e}")
+            c.execute('COMMIT')
+        except Exception as e:
+            print(f"[ERROR] Failed to write {len(batch)} analytics event(s): {e}")
+            if conn.in_transaction:
+                conn.rollback()
+
+    conn.close()
+
+def _stop_analytics_writer():
+    """Flush pending analytics writes at interpreter exit"""
+    if _analytics_writer is not None and _analytics_writer.is_alive():
+        _analytics_queue.put(None)
+        _analytics_writer.join(timeout=5)
+
+def queue_analytics_write(write, *args):
+    """Queue write(cursor, *args) for the writer thread, starting it on first use"""
+    global _analytics_writer
+    if _analytics_writer is None:
+        with _analytics_writer_lock:
+            if _analytics_writer is None:
+                _analytics_writer = threading.Thread(
+                    target=_write_analytics_batches, name='analytics-writer', daemon=True
+                )
+                _analytics_writer.start()
+                atexit.register(_stop_analytics_writer)
+    _analytics_queue.put_nowait((write, args))
+
+# Register newsletter subscription routes; their analytics rows go through
+# the batched writer above
+try:
+    from subscription_routes import register_subscription_routes
+    register_subscription_routes(app, queue_write=queue_analytics_write)
+    print("[INFO] Newsletter subscription routes registered")
+except ImportError as e:
+    print(f"[WARNING] Failed to load subscription routes: {e}")
+    print(f"[WARNING] Make sure subscription_routes.py exists in the project directory")
+except Exception as e:
+    print(f"[ERROR] Error registering subscription routes: {e}")
+
+def _record_visit(c, ip_hash, user_agent, page_url, session_id, referrer):
+    """Write a page visit with its session, funnel and referrer rows (writer thread)"""
+    # Insert visitor record
+    c.execute('''INSERT INTO visitors (ip_hash, user_agent, page_url, session_id)
+                VALUES (?, ?, ?, ?)''', (ip_hash, user_agent, page_url, session_id))
+
+    # Update or create session
+    c.execute('SELECT session_id FROM user_sessions WHERE session_id = ?', (session_id,))
+    session_exists = c.fetchone()
+
+    if not session_exists:
+        # Parse device info; only new sessions store it
+        device_info = parse_user_agent(user_agent)
+
+        # Create new session
+        c.execute('''INSERT INTO user_sessions
+                    (session_id, visitor_id, landing_page, referrer_url, device_type, browser, os)
+                    VALUES (?, ?, ?, ?, ?, ?, ?)''',
+                 (session_id, ip_hash, page_url, referrer,
+                  device_info['device_type'], device_info['browser'], device_info['os']))
+
+        # Track funnel: homepage visit
+        if page_url == '/':
+            c.execute('''INSERT INTO conversion_funnels (session_id, funnel_step, metadata)
+                        VALUES (?, ?, ?)''', (session_id, 'homepage', json.dumps({'referrer': referrer})))
+
+        # Track referrer (one upsert on the unique (referrer_url, landing_page) index)
+        if referrer != 'direct':
+            c.execute('''INSERT INTO referrers (referrer_url, landing_page, count)
+                        VALUES (?, ?, 1)
+                        ON CONFLICT(referrer_url, landing_page) DO UPDATE
+                        SET count = count + 1, last_seen = CURRENT_TIMESTAMP''',
+                     (referrer, page_url))
+    else:
+        # Update existing session
+        c.execute('UPDATE user_sessions SET total_pages = total_pages + 1 WHERE session_id = ?',
+                 (session_id,))
+
+# Key for the visitor pseudonyms. Without a secret key an IPv4 hash can be
+# reversed by hashing all 2**32 addresses; set PSEUDO_KEY in production.
+_PSEUDO_KEY = hashlib.blake2b(os.environ.get('PSEUDO_KEY', 'torq').encode(), digest_size=32).digest()
+
+@functools.lru_cache(maxsize=4096)
+def pseudonymize_ip(ip):
+    """Keyed 8-byte BLAKE2b of an IP address, as 16 hex chars"""
+    return hashlib.blake2b(ip.encode(), key=_PSEUDO_KEY, digest_size=8).hexdigest()
+
+@functools.lru_cache(maxsize=4096)
+def session_seed(ip, user_agent, hour):
+    """Session ID for a visitor without a cookie, stable for the hour
+
+    The personalization string keeps it from colliding with IP pseudonyms.
+    """
+    return hashlib.blake2b(
+        f"{ip}{user_agent}{hour}".encode(), key=_PSEUDO_KEY, digest_size=8, person=b'session'
+    ).hexdigest()
+
 # Visitor tracking with enhanced device detection
 def track_visitor(page_url):
-    """Track visitor analytics with device detection"""
+    """Track visitor analytics with device detection
+
+    Only the hashes are computed on the request path; the database writes
+    are queued for the batched analytics writer.
+    """
     try:
         ip = request.remote_addr
         user_agent = request.headers.get('User-Agent', '')
         referrer = request.headers.get('Referer', 'direct')
 
         # Hash IP for privacy
-        ip_hash = hashlib.sha256(ip.encode()).hexdigest()[:16]
-
-        # Generate session ID
-        session_id = request.cookies.get('session_id', hashlib.sha256(
-            f"{ip}{user_agent}{datetime.now().hour}".encode()
-        ).hexdigest()[:16])
-
-        # Parse device info
-        device_info = parse_user_agent(user_agent)
+        ip_hash = pseudonymize_ip(ip)
 
-        conn = sqlite3.connect(DB_PATH)
-        c = conn.cursor()
-
-        # Insert visitor record
-        c.execute('''INSERT INTO visitors (ip_hash, user_agent, page_url, session_id)
-                    VALUES (?, ?, ?, ?)''', (ip_hash, user_agent, page_url, session_id))
-
-        # Update or create session
-        c.execute('SELECT session_id FROM user_sessions WHERE session_id = ?', (session_id,))
-        session_exists = c.fetchone()
-
-        if not session_exists:
-            # Create new session
-            c.execute('''INSERT INTO user_sessions
-                        (session_id, visitor_id, landing_page, referrer_url, device_type, browser, os)
-                        VALUES (?, ?, ?, ?, ?, ?, ?)''',
-                     (session_id, ip_hash, page_url, referrer,
-                      device_info['device_type'], device_info['browser'], device_info['os']))
-
-            # Track funnel: homepage visit
-            if page_url == '/':
-                c.execute('''INSERT INTO conversion_funnels (session_id, funnel_step, metadata)
-                            VALUES (?, ?, ?)''', (session_id, 'homepage', json.dumps({'referrer': referrer})))
-
-            # Track referrer
-            if referrer != 'direct':
-                c.execute('SELECT id, count FROM referrers WHERE referrer_url = ? AND landing_page = ?',
-                         (referrer, page_url))
-                ref_result = c.fetchone()
-                if ref_result:
-                    c.execute('UPDATE referrers SET count = ?, last_seen = CURRENT_TIMESTAMP WHERE id = ?',
-                             (ref_result[1] + 1, ref_result[0]))
-                else:
-                    c.execute('''INSERT INTO referrers (referrer_url, landing_page, count)
-                                VALUES (?, ?, 1)''', (referrer, page_url))
-        else:
-            # Update existing session
-            c.execute('UPDATE user_sessions SET total_pages = total_pages + 1 WHERE session_id = ?',
-                     (session_id,))
+        # Generate session ID (only when the visitor has no cookie yet)
+        session_id = request.cookies.get('session_id')
+        if session_id is None:
+            session_id = session_seed(ip, user_agent, datetime.now().hour)
 
-        conn.commit()
-        conn.close()
+        queue_analytics_write(_record_visit, ip_hash, user_agent, page_url, session_id, referrer)
 
         return session_id
     except Exception as e:
         print(f"[ERROR] Tracking error: {e}")
         return None
 
+def _record_article_view(c, article_id, article_title, session_id):
+    """Count an article view and its funnel step (writer thread)"""
+    # One atomic upsert instead of SELECT then UPDATE or INSERT
+    c.execute('''INSERT INTO page_views (article_id, article_title, view_count)
+                VALUES (?, ?, 1)
+                ON CONFLICT(article_id) DO UPDATE
+                SET view_count = view_count + 1, last_viewed = CURRENT_TIMESTAMP''',
+             (article_id, article_title))
+
+    # Track funnel: article view
+    if session_id:
+        c.execute('''INSERT INTO conversion_funnels (session_id, funnel_step, metadata)
+                    VALUES (?, ?, ?)''',
+                 (session_id, 'article_view', json.dumps({'article_id': article_id, 'title': article_title})))
+
 def track_article_view(article_id, article_title):
     """Track article views"""
     try:
         session_id = request.cookies.get('session_id')
-
-        conn = sqlite3.connect(DB_PATH)
-        c = conn.cursor()
-
-        # Check if article exists in page_views
-        c.execute('SELECT view_count FROM page_views WHERE article_id = ?', (article_id,))
-        result = c.fetchone()
-
-        if result:
-            # Update view count
-            new_count = result[0] + 1
-            c.execute('''UPDATE page_views SET view_count = ?, last_viewed = CURRENT_TIMESTAMP
-                        WHERE article_id = ?''', (new_count, article_id))
-        else:
-            # Insert new record
-            c.execute('''INSERT INTO page_views (article_id, article_title, view_count)
-                        VALUES (?, ?, 1)''', (article_id, article_title))
-
-        # Track funnel: article view
-        if session_id:
-            c.execute('''INSERT INTO conversion_funnels (session_id, funnel_step, metadata)
-                        VALUES (?, ?, ?)''',
-                     (session_id, 'article_view', json.dumps({'article_id': article_id, 'title': article_title})))
-
-        conn.commit()
-        conn.close()
+        queue_analytics_write(_record_article_view, article_id, article_title, session_id)
     except Exception as e:
         print(f"[ERROR] Article tracking error: {e}")
 
 # ===== ADVANCED ANALYTICS API ENDPOINTS =====
 
+def _record_event(c, session_id, event_type, element_id, value, page_url):
+    """Write a user event and any funnel step it completes (writer thread)"""
+    c.execute('''INSERT INTO user_events (session_id, event_type, element_id, value, page_url)
+                VALUES (?, ?, ?, ?, ?)''',
+             (session_id, event_type, element_id, str(value), page_url))
+
+    # Track specific funnel events
+    if event_type == 'scroll_depth' and value == '100':
+        c.execute('''INSERT INTO conversion_funnels (session_id, funnel_step, metadata)
+                    VALUES (?, ?, ?)''',
+                 (session_id, 'scroll_100', json.dumps({'page': page_url})))
+    elif event_type == 'outbound_link':
+        c.execute('''INSERT INTO conversion_funnels (session_id, funnel_step, metadata)
+                    VALUES (?, ?, ?)''',
+                 (session_id, 'external_click', json.dumps({'url': value})))
+
+def _record_session(c, session_id, action, duration, screen_resolution):
+    """Apply a session lifecycle update (writer thread)"""
+    if action == 'end':
+        # Calculate bounce rate (1 if only one page viewed, 0 otherwise)
+        c.execute('SELECT total_pages FROM user_sessions WHERE session_id = ?', (session_id,))
+        result = c.fetchone()
+        if result:
+            bounce_rate = 1.0 if result[0] <= 1 else 0.0
+            c.execute('''UPDATE user_sessions
+                        SET end_time = CURRENT_TIMESTAMP, duration_seconds = ?,
+                            bounce_rate = ?, is_active = 0
+                        WHERE session_id = ?''',
+                     (duration, bounce_rate, session_id))
+    elif action == 'update':
+        c.execute('''UPDATE user_sessions
+                    SET duration_seconds = ?, screen_resolution = ?
+                    WHERE session_id = ?''',
+                 (duration, screen_resolution, session_id))
+
 @app.route('/api/track-event', methods=['POST'])
 def track_event():
     """Track user events (scroll, click, time-on-page, etc.)"""
@@ -479,26 +845,8 @@ def track_event():
         if not session_id or not event_type:
             return jsonify({'error': 'Missing required fields'}), 400
 
-        conn = sqlite3.connect(DB_PATH)
-        c = conn.cursor()
-
-        # Insert event
-        c.execute('''INSERT INTO user_events (session_id, event_type, element_id, value, page_url)
-                    VALUES (?, ?, ?, ?, ?)''',
-                 (session_id, event_type, element_id, str(value), page_url))
-
-        # Track specific funnel events
-        if event_type == 'scroll_depth' and value == '100':
-            c.execute('''INSERT INTO conversion_funnels (session_id, funnel_step, metadata)
-                        VALUES (?, ?, ?)''',
-                     (session_id, 'scroll_100', json.dumps({'page': page_url})))
-        elif event_type == 'outbound_link':
-            c.execute('''INSERT INTO conversion_funnels (session_id, funnel_step, metadata)
-                        VALUES (?, ?, ?)''',
-                     (session_id, 'external_click', json.dumps({'url': value})))
-
-        conn.commit()
-        conn.close()
+        # Queued behind this session's visit writes, so they land in order
+        queue_analytics_write(_record_event, session_id, event_type, element_id, value, page_url)
 
         return jsonify({'status': 'success'}), 200
 
@@ -519,28 +867,8 @@ def track_session():
         if not session_id:
             return jsonify({'error': 'Missing session_id'}), 400
 
-        conn = sqlite3.connect(DB_PATH)
-        c = conn.cursor()
-
-        if action == 'end':
-            # Calculate bounce rate (1 if only one page viewed, 0 otherwise)
-            c.execute('SELECT total_pages FROM user_sessions WHERE session_id = ?', (session_id,))
-            result = c.fetchone()
-            if result:
-                bounce_rate = 1.0 if result[0] <= 1 else 0.0
-                c.execute('''UPDATE user_sessions
-                            SET end_time = CURRENT_TIMESTAMP, duration_seconds = ?,
-                                bounce_rate = ?, is_active = 0
-                            WHERE session_id = ?''',
-                         (duration, bounce_rate, session_id))
-        elif action == 'update':
-            c.execute('''UPDATE user_sessions
-                        SET duration_seconds = ?, screen_resolution = ?
-                        WHERE session_id = ?''',
-                     (duration, screen_resolution, session_id))
-
-        conn.commit()
-        conn.close()
+        # Queued behind the visit that creates the session row, so it exists by then
+        queue_analytics_write(_record_session, session_id, action, duration, screen_resolution)
 
         return jsonify({'status': 'success'}), 200
 
@@ -552,7 +880,7 @@ def track_session():
 def advanced_analytics():
     """Get advanced analytics data"""
     try:
-        conn = sqlite3.connect(DB_PATH)
+        conn = get_conn()
         c = conn.cursor()
 
         # Average session duration
@@ -620,8 +948,6 @@ def advanced_analytics():
                     WHERE start_time > datetime('now', '-7 days')''')
         total_sessions = c.fetchone()[0] or 0
 
-        conn.close()
-
         return jsonify({
             'avg_session_duration': round(avg_duration, 2),
             'bounce_rate': round(bounce_rate * 100, 2),
@@ -640,65 +966,146 @@ def advanced_analytics():
         print(f"[ERROR] Advanced analytics error: {e}")
         return jsonify({'error': str(e)}), 500
 
+# Static asset caching. These URLs are not versioned, so browsers keep them
+# for an hour and then revalidate (send_from_directory answers with 304 when
+# the ETag / Last-Modified still match).
+STATIC_MAX_AGE = 3600
+DATA_CACHE_MAX_AGE = 60
+
+# Template output nodes joined per chunk when streaming article pages
+ARTICLE_STREAM_BUFFER = 16
+
+# Script files served by serve_js, without the .js extension
+_JS_FILES = frozenset({
+    'analytics',
+    'script',
+    'make_articles_clickable',
+    'populate_ai_section',
+    'populate_main_articles',
+})
+
+# Today's date as shown on article pages, reformatted only when the day changes
+_today = {'day': None, 'date': None}
+
+def formatted_today():
+    """Return today's date as "Month DD, YYYY", formatting it once per day"""
+    now = datetime.now()
+    day = now.date()
+    if _today['day'] != day:
+        _today['date'] = now.strftime("%B %d, %Y")
+        _today['day'] = day
+    return _today['date']
+
+# Response timestamp, reformatted at most once per second
+_now_iso = {'second': None, 'iso': None}
+
+def now_iso():
+    """Return the current local time as an ISO 8601 string at one-second resolution"""
+    second = int(time.time())
+    if _now_iso['second'] != second:
+        _now_iso['iso'] = datetime.fromtimestamp(second).isoformat()
+        _now_iso['second'] = second
+    return _now_iso['iso']
+
+@functools.lru_cache(maxsize=256)
+def extracted_article_html(full_text, source, link):
+    """Article body for extracted content: attribution banner, paragraphs and source link
+
+    Cached per article, so repeat views reuse the rendered HTML. The page is
+    served as UTF-8, so the original typography is kept.
+    """
+    # Format article text into HTML paragraphs (escape HTML to prevent injection)
+    formatted_content = ''.join(f'<p>{html.escape(p.strip())}</p>' for p in full_text.split('\n\n') if p.strip())
+
+    # Add source attribution banner at the top
+    source_name = html.escape(source)
+    source_url = html.escape(link)
+
+    source_banner = f"""
+        <div class="source-attribution">
+            <div class="attribution-icon">ℹ️</div>
+            <div class="attribution-text">
+                <strong>Content from {source_name}</strong>
+                <p>This article is aggregated from the original source. We've extracted and displayed it here for your convenience with proper attribution.</p>
+            </div>
+        </div>
+        """
+
+    return f"""
+        {source_banner}
+        <div class="article-full-content extracted-content">
+            {formatted_content}
+        </div>
+        <div class="original-source-cta">
+            <a href="{source_url}" target="_blank" rel="noopener noreferrer" class="read-original-btn">
+                📰 Read Original Article at {source_name}
+            </a>
+        </div>
+        """
+
+@functools.lru_cache(maxsize=2048)
+def article_structured_data(title, excerpt, author, date, category):
+    """schema.org NewsArticle JSON-LD for an article, escaped for a <script> block"""
+    return htmlsafe_json_dumps({
+        "@context": "https://schema.org",
+        "@type": "NewsArticle",
+        "headline": title,
+        "description": excerpt,
+        "author": {
+            "@type": "Person",
+            "name": author
+        },
+        "publisher": {
+            "@type": "Organization",
+            "name": "TORQ Tech News",
+            "logo": {
+                "@type": "ImageObject",
+                "url": "https://torqtechnews.com/torq-logo.svg"
+            }
+        },
+        "datePublished": date,
+        "articleSection": category
+    }, dumps=app.json.dumps)
+
 # Routes
 @app.route('/')
 def home():
     """Home page"""
     session_id = track_visitor('/')
 
-    # Load articles from cache
-    try:
-        with open(DATA_CACHE_PATH, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-            articles = data.get('articles', [])
-    except Exception as e:
-        print(f"[ERROR] Failed to load cache in home route: {e}")
-        articles = []
-
     response = send_from_directory('.', 'index.html')
     if session_id:
         response.set_cookie('session_id', session_id, max_age=86400)  # 24 hours
     return response
 
-@app.route('/analytics.js')
-def serve_analytics_js():
-    """Serve analytics tracking script"""
-    return send_from_directory('.', 'analytics.js')
+@app.route('/<name>.js')
+def serve_js(name):
+    """Serve one of the site's JavaScript files"""
+    if name not in _JS_FILES:
+        return "Not found", 404
+    return send_from_directory('.', f'{name}.js', max_age=STATIC_MAX_AGE)
 
 @app.route('/styles.css')
 def serve_css():
     """Serve CSS file"""
-    return send_from_directory('.', 'styles.css')
-
-@app.route('/script.js')
-def serve_js():
-    """Serve main JavaScript file"""
-    return send_from_directory('.', 'script.js')
+    return send_from_directory('.', 'styles.css', max_age=STATIC_MAX_AGE)
 
-@app.route('/make_articles_clickable.js')
-def serve_clickable_js():
-    """Serve clickable articles JavaScript"""
-    return send_from_directory('.', 'make_articles_clickable.js')
-
-@app.route('/populate_ai_section.js')
-def serve_ai_js():
-    """Serve AI section JavaScript"""
-    return send_from_directory('.', 'populate_ai_section.js')
-
-@app.route('/populate_main_articles.js')
-def serve_main_articles_js():
-    """Serve main articles population JavaScript"""
-    return send_from_directory('.', 'populate_main_articles.js')
+@app.route('/article-detail.css')
+def serve_article_css():
+    """Serve the article page stylesheet (URL is versioned by content hash)"""
+    response = send_from_directory('.', 'article-detail.css', max_age=31536000)
+    response.cache_control.immutable = True
+    return response
 
 @app.route('/data_cache.json')
 def serve_data_cache():
     """Serve data cache for client-side rendering"""
-    return send_from_directory(DB_DIR, 'data_cache.json')
+    return send_from_directory(DB_DIR, 'data_cache.json', max_age=DATA_CACHE_MAX_AGE)
 
 @app.route('/torq-logo.svg')
 def serve_logo():
     """Serve TORQ logo"""
-    return send_from_directory(DB_DIR, 'torq-logo.svg')
+    return send_from_directory(DB_DIR, 'torq-logo.svg', max_age=STATIC_MAX_AGE)
 
 
 @app.route('/topics/<topic>')
@@ -708,9 +1115,7 @@ def topic_page(topic):
 
     # Load articles from cache
     try:
-        with open(DATA_CACHE_PATH, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-            all_articles = data.get('articles', [])
+        all_articles = get_cache().get('articles', [])
     except Exception as e:
         print(f"[ERROR] Failed to load cache: {e}")
         all_articles = []
@@ -758,28 +1163,39 @@ def article_detail(slug):
 
     # Load data cache to get article data
     try:
-        with open(DATA_CACHE_PATH, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-            articles = data.get('articles', [])
-            featured = data.get('featured', {})
+        cache = load_data_cache()
+        articles = cache['data'].get('articles', [])
+        featured = cache['data'].get('featured', {})
+        by_slug = cache['by_slug']
+        slug_prefix = cache['slug_prefix']
     except Exception as e:
         print(f"[ERROR] Failed to load data cache: {e}")
         articles = []
         featured = {}
+        by_slug = {}
+        slug_prefix = []
 
     # Check featured article first
     if featured and featured.get('slug') == slug:
         cached_article = featured
     else:
-        # Find matching article in regular articles using normalized slug
-        cached_article = next((a for a in articles if a.get('slug') == slug), None)
+        # Find matching article in regular articles through the slug index
+        cached_article = by_slug.get(slug)
 
     # If still not found, try fuzzy matching
     if not cached_article:
         if featured and featured.get('slug', '').startswith(slug[:20]):
             cached_article = featured
         else:
-            cached_article = next((a for a in articles if a.get('slug', '').startswith(slug[:20])), None)
+            # Matching slugs sit together in the sorted index; take the earliest article
+            prefix = slug[:20]
+            first = None
+            for candidate, i in slug_prefix[bisect.bisect_left(slug_prefix, (prefix,)):]:
+                if not candidate.startswith(prefix):
+                    break
+                if first is None or i < first:
+                    first = i
+            cached_article = articles[first] if first is not None else None
 
     if not cached_article:
         return "Article not found", 404
@@ -793,42 +1209,11 @@ def article_detail(slug):
     # Prepare article content
     if has_extracted_content:
         # Use extracted content with proper attribution
-        article_content = cached_article.get('full_text', '')
-
-        # Normalize Unicode text to ASCII for Windows compatibility
-        # First normalize to decomposed form (NFD), then encode as ASCII ignoring errors
-        article_content = unicodedata.normalize('NFKD', article_content)
-        article_content = article_content.encode('ascii', 'ignore').decode('ascii')
-
-        # Format article text into HTML paragraphs (escape HTML to prevent injection)
-        paragraphs = article_content.split('\n\n')
-        formatted_content = ''.join(f'<p>{html.escape(p.strip())}</p>' for p in paragraphs if p.strip())
-
-        # Add source attribution banner at the top
-        source_name = html.escape(cached_article.get('source', 'Original Source'))
-        source_url = html.escape(cached_article.get('link', '#'))
-
-        source_banner = f"""
-        <div class="source-attribution">
-            <div class="attribution-icon">ℹ️</div>
-            <div class="attribution-text">
-                <strong>Content from {source_name}</strong>
-                <p>This article is aggregated from the original source. We've extracted and displayed it here for your convenience with proper attribution.</p>
-            </div>
-        </div>
-        """
-
-        full_content = f"""
-        {source_banner}
-        <div class="article-full-content extracted-content">
-            {formatted_content}
-        </div>
-        <div class="original-source-cta">
-            <a href="{source_url}" target="_blank" rel="noopener noreferrer" class="read-original-btn">
-                📰 Read Original Article at {source_name}
-            </a>
-        </div>
-        """
+        full_content = extracted_article_html(
+            cached_article.get('full_text', ''),
+            cached_article.get('source', 'Original Source'),
+            cached_article.get('link', '#')
+        )
 
         # Use summary for excerpt if available
         excerpt = cached_article.get('summary', cached_article.get('excerpt', ''))
@@ -843,230 +1228,34 @@ def article_detail(slug):
         excerpt = cached_article.get('excerpt', '')
         keywords = cached_article.get('category', 'Technology')
 
-    # Prepare meta information (escape for HTML safety)
-    title = html.escape(cached_article.get('title', 'Article'))
-    category = html.escape(cached_article.get('category', 'Technology'))
-    author = html.escape(cached_article.get('author', 'Unknown'))
-    date = html.escape(cached_article.get('date', datetime.now().strftime("%B %d, %Y")))
+    # Prepare meta information. The template autoescapes each field; only
+    # full_content and the (cached) structured data are markup.
+    title = cached_article.get('title', 'Article')
+    category = cached_article.get('category', 'Technology')
+    author = cached_article.get('author', 'Unknown')
+    date = cached_article['date'] if 'date' in cached_article else formatted_today()
     reading_time = cached_article.get('reading_time', 10)
 
-    # Prepare excerpt and keywords for meta tags (escape quotes and HTML)
-    excerpt_text = excerpt.replace('"', '&quot;').replace("'", '&#39;')[:160]
-    keywords_text = keywords.replace('"', '&quot;').replace("'", '&#39;') if keywords else ''
-
-    # Prepare JSON-safe strings for structured data
-    title_json = title.replace('"', '\\"')
-    author_json = author.replace('"', '\\"')
-    excerpt_json = excerpt_text[:200].replace('"', '\\"')
-    category_json = category.replace('"', '\\"')
-
-    # Render article template with SEO optimization
-    article_html = f"""
-    <!DOCTYPE html>
-    <html lang="en">
-    <head>
-        <meta charset="UTF-8">
-        <meta name="viewport" content="width=device-width, initial-scale=1.0">
-
-        <!-- SEO Meta Tags -->
-        <title>{title} - TORQ Tech News</title>
-        <meta name="description" content="{excerpt_text}">
-        <meta name="keywords" content="{keywords_text}">
-        <meta name="author" content="{author}">
-
-        <!-- Open Graph / Facebook -->
-        <meta property="og:type" content="article">
-        <meta property="og:title" content="{title}">
-        <meta property="og:description" content="{excerpt_text[:200]}">
-        <meta property="og:site_name" content="TORQ Tech News">
-
-        <!-- Twitter Card -->
-        <meta name="twitter:card" content="summary_large_image">
-        <meta name="twitter:title" content="{title}">
-        <meta name="twitter:description" content="{excerpt_text[:200]}">
-
-        <!-- Structured Data (Schema.org) -->
-        <script type="application/ld+json">
-        {{
-          "@context": "https://schema.org",
-          "@type": "NewsArticle",
-          "headline": "{title_json}",
-          "description": "{excerpt_json}",
-          "author": {{
-            "@type": "Person",
-            "name": "{author_json}"
-          }},
-          "publisher": {{
-            "@type": "Organization",
-            "name": "TORQ Tech News",
-            "logo": {{
-              "@type": "ImageObject",
-              "url": "https://torqtechnews.com/torq-logo.svg"
-            }}
-          }},
-          "datePublished": "{date}",
-          "articleSection": "{category_json}"
-        }}
-        </script>
-
-        <link rel="stylesheet" href="/styles.css">
-        <script src="/analytics.js" defer></script>
-        <style>
-            .article-detail {{
-                max-width: 800px;
-                margin: 0 auto;
-                padding: 2rem;
-            }}
-            .article-header {{
-                margin-bottom: 2rem;
-                padding-bottom: 2rem;
-                border-bottom: 2px solid #e0e0e0;
-            }}
-            .article-title {{
-                font-size: 2.5rem;
-                font-weight: 800;
-                margin-bottom: 1rem;
-                color: #1a1a1a;
-                line-height: 1.2;
-            }}
-            .article-meta {{
-                display: flex;
-                gap: 1rem;
-                color: #666;
-                font-size: 0.9rem;
-                flex-wrap: wrap;
-            }}
-            .source-attribution {{
-                background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-                color: white;
-                padding: 1.5rem;
-                border-radius: 12px;
-                margin-bottom: 2rem;
-                display: flex;
-                gap: 1rem;
-                align-items: flex-start;
-            }}
-            .attribution-icon {{
-                font-size: 2rem;
-                flex-shrink: 0;
-            }}
-            .attribution-text strong {{
-                display: block;
-                font-size: 1.1rem;
-                margin-bottom: 0.5rem;
-            }}
-            .attribution-text p {{
-                margin: 0;
-                opacity: 0.95;
-                font-size: 0.95rem;
-            }}
-            .article-full-content {{
-                line-height: 1.8;
-                font-size: 1.1rem;
-            }}
-            .article-full-content p {{
-                margin-bottom: 1.5rem;
-                color: #2d2d2d;
-            }}
-            .article-full-content h3 {{
-                margin-top: 2rem;
-                margin-bottom: 1rem;
-                font-size: 1.8rem;
-                color: #2d2d2d;
-            }}
-            .extracted-content p {{
-                text-align: justify;
-            }}
-            .lead-paragraph {{
-                font-size: 1.25rem;
-                font-weight: 500;
-                color: #404040;
-            }}
-            .key-takeaways {{
-                background-color: #f5f5f5;
-                padding: 2rem;
-                border-left: 4px solid #ef233c;
-                margin-top: 2rem;
-            }}
-            .key-takeaways h4 {{
-                margin-top: 0;
-                color: #ef233c;
-            }}
-            .original-source-cta {{
-                margin-top: 3rem;
-                padding: 2rem;
-                background: linear-gradient(135deg, #ef233c 0%, #d32f2f 100%);
-                border-radius: 12px;
-                text-align: center;
-            }}
-            .read-original-btn {{
-                display: inline-block;
-                padding: 1rem 2rem;
-                background: white;
-                color: #ef233c;
-                text-decoration: none;
-                font-weight: 700;
-                font-size: 1.1rem;
-                border-radius: 8px;
-                transition: all 0.3s ease;
-                box-shadow: 0 4px 12px rgba(0, 0, 0, 0.15);
-            }}
-            .read-original-btn:hover {{
-                transform: translateY(-2px);
-                box-shadow: 0 6px 20px rgba(0, 0, 0, 0.25);
-            }}
-            .back-link {{
-                display: inline-block;
-                margin: 2rem 0;
-                color: #ef233c;
-                text-decoration: none;
-                font-weight: 600;
-                font-size: 1rem;
-            }}
-            .back-link:hover {{
-                text-decoration: underline;
-            }}
-            @media (max-width: 768px) {{
-                .article-title {{
-                    font-size: 2rem;
-                }}
-                .article-detail {{
-                    padding: 1rem;
-                }}
-            }}
-        </style>
-    </head>
-    <body>
-        <div class="article-detail">
-            <a href="/" class="back-link">← Back to Home</a>
-
-            <div class="article-header">
-                <div class="article-category" style="color: #ef233c; font-weight: 600; margin-bottom: 1rem; text-transform: uppercase; letter-spacing: 1px;">
-                    {category}
-                </div>
-                <h1 class="article-title">{title}</h1>
-                <div class="article-meta">
-                    <span>By {author}</span>
-                    <span>•</span>
-                    <span>{date}</span>
-                    <span>•</span>
-                    <span>{reading_time} min read</span>
-                </div>
-            </div>
-
-            {full_content}
-
-            <a href="/" class="back-link">← Back to Home</a>
-        </div>
-
-        <script src="/script.js"></script>
-    </body>
-    </html>
-    """
+    # Render article template with SEO optimization.
+    # The page is streamed: the <head> goes out before the body is rendered,
+    # and buffering keeps it to a few writes instead of one per template node.
+    article_stream = app.jinja_env.get_template('article_detail.html').stream(
+        title=title,
+        excerpt=excerpt[:160],
+        keywords=keywords or '',
+        author=author,
+        date=date,
+        category=category,
+        reading_time=reading_time,
+        full_content=Markup(full_content),
+        structured_data=article_structured_data(title, excerpt[:160], author, date, category),
+        css_version=ARTICLE_CSS_VERSION
+    )
+    article_stream.enable_buffering(ARTICLE_STREAM_BUFFER)
 
-    # Encode HTML response as UTF-8 bytes to handle special characters
+    # Chunks are encoded as UTF-8 as they are sent, to handle special characters
     response = app.response_class(
-        response=article_html.encode('utf-8'),
+        response=article_stream,
         status=200,
         mimetype='text/html; charset=utf-8'
     )
@@ -1079,29 +1268,26 @@ def article_detail(slug):
 @app.route('/api/analytics')
 def analytics():
     """Analytics dashboard data"""
-    conn = sqlite3.connect(DB_PATH)
+    conn = get_conn()
     c = conn.cursor()
 
-    # Total visitors (last 24 hours)
-    c.execute('''SELECT COUNT(DISTINCT session_id) FROM visitors
-                WHERE timestamp > datetime('now', '-1 day')''')
-    visitors_24h = c.fetchone()[0]
-
-    # Total page views
-    c.execute('SELECT COUNT(*) FROM visitors')
-    total_views = c.fetchone()[0]
+    # Total visitors (last 24 hours, a range search on the timestamp index) and
+    # total page views (the trigger-maintained counter) in one statement
+    c.execute('''SELECT
+                    (SELECT COUNT(DISTINCT session_id) FROM visitors
+                     WHERE timestamp > datetime('now', '-1 day')),
+                    COALESCE((SELECT value FROM meta WHERE key = 'total_views'), 0)''')
+    visitors_24h, total_views = c.fetchone()
 
     # Top articles
     c.execute('''SELECT article_title, view_count FROM page_views
                 ORDER BY view_count DESC LIMIT 10''')
-    top_articles = [{'title': row[0], 'views': row[1]} for row in c.fetchall()]
+    top_articles = [{'title': title, 'views': views} for title, views in c]
 
     # Recent visitors
     c.execute('''SELECT page_url, timestamp FROM visitors
                 ORDER BY timestamp DESC LIMIT 20''')
-    recent_activity = [{'page': row[0], 'time': row[1]} for row in c.fetchall()]
-
-    conn.close()
+    recent_activity = [{'page': page, 'time': ts} for page, ts in c]
 
     return jsonify({
         'visitors_24h': visitors_24h,
@@ -1115,26 +1301,40 @@ def admin_dashboard():
     """Admin dashboard"""
     return send_from_directory('.', 'admin_dashboard.html')
 
+# The scraper modules are imported on first use (they are heavy, and the Vercel
+# deploy leaves them out via .vercelignore), then one instance of each is
+# shared by every caller
+@functools.cache
+def get_content_agent():
+    """Return the shared automation_agent.ContentAgent"""
+    import automation_agent
+    return automation_agent.ContentAgent()
+
+@functools.cache
+def get_aggregator():
+    """Return the shared multi_source_aggregator.MultiSourceAggregator"""
+    import multi_source_aggregator
+    return multi_source_aggregator.MultiSourceAggregator()
+
 @app.route('/api/cron/update-content')
 def cron_update_content():
     """Vercel Cron Job endpoint for automated content updates"""
     try:
         print("[CRON] Vercel Cron Job triggered")
-        import automation_agent
-        agent = automation_agent.ContentAgent()
+        agent = get_content_agent()
         result = agent.run()
 
         return jsonify({
             "status": "success",
             "message": "Content updated successfully",
-            "timestamp": datetime.now().isoformat()
+            "timestamp": now_iso()
         })
     except Exception as e:
         print(f"[CRON ERROR] {e}")
         return jsonify({
             "status": "error",
             "message": str(e),
-            "timestamp": datetime.now().isoformat()
+            "timestamp": now_iso()
         }), 500
 
 @app.route('/api/manual-update')
@@ -1142,8 +1342,7 @@ def manual_update():
     """Manual trigger for content update"""
     try:
         print("[MANUAL] Manual update triggered")
-        import multi_source_aggregator
-        aggregator = multi_source_aggregator.MultiSourceAggregator()
+        aggregator = get_aggregator()
         result = aggregator.fetch_all_articles()
 
         return jsonify({
@@ -1151,41 +1350,54 @@ def manual_update():
             "message": "Content updated successfully from multiple sources",
             "sources": result.get('sources_used', []),
             "article_count": len(result.get('articles', [])),
-            "timestamp": datetime.now().isoformat()
+            "timestamp": now_iso()
         })
     except Exception as e:
         print(f"[MANUAL ERROR] {e}")
         return jsonify({
             "status": "error",
             "message": str(e),
-            "timestamp": datetime.now().isoformat()
+            "timestamp": now_iso()
         }), 500
 
+# Serialized healthy /health body and the inputs it was built from. Probes
+# arrive far more often than any of them change, so the JSON is only rebuilt
+# when the data cache, the visitor total or the (one-second) timestamp moves on.
+_health_cache = {'key': None, 'body': None}
+
 @app.route('/health')
 @app.route('/api/health')
 def health_check():
     """System health check endpoint for monitoring and n8n workflows"""
+    global _health_cache
     try:
-        # Check if data_cache.json exists and is valid
-        with open(DATA_CACHE_PATH, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        # Check if data_cache.json exists and is valid (parsed copy, re-read only when it changes)
+        state = load_data_cache()
+        data = state['data']
 
         article_count = len(data.get('articles', []))
         last_update = data.get('timestamp', 'Unknown')
         sources_used = data.get('sources_used', [])
 
-        # Check database connectivity
-        conn = sqlite3.connect(DB_PATH)
+        # Check database connectivity; the visitor total is the trigger-maintained
+        # counter, a single-row lookup instead of a scan of the visitors table
+        conn = get_conn()
         c = conn.cursor()
-        c.execute('SELECT COUNT(*) FROM visitors')
-        total_visitors = c.fetchone()[0]
-        conn.close()
+        c.execute("SELECT value FROM meta WHERE key = 'total_views'")
+        row = c.fetchone()
+        total_visitors = row[0] if row else 0
 
-        return jsonify({
+        timestamp = now_iso()
+        key = (state['stamp'], total_visitors, timestamp)
+        cached = _health_cache
+        if cached['key'] == key:
+            return app.response_class(cached['body'], mimetype=app.json.mimetype), 200
+
+        response = jsonify({
             'status': 'healthy',
             'version': '1.0.0',
             'service': 'TORQ Tech News',
-            'timestamp': datetime.now().isoformat(),
+            'timestamp': timestamp,
             'data': {
                 'article_count': article_count,
                 'last_update': last_update,
@@ -1197,13 +1409,15 @@ def health_check():
                 'cache': 'operational',
                 'aggregator': 'operational'
             }
-        }), 200
+        })
+        _health_cache = {'key': key, 'body': response.get_data()}
+        return response, 200
     except FileNotFoundError:
         return jsonify({
             'status': 'degraded',
             'version': '1.0.0',
             'service': 'TORQ Tech News',
-            'timestamp': datetime.now().isoformat(),
+            'timestamp': now_iso(),
             'error': 'Data cache not found',
             'components': {
                 'database': 'operational',
@@ -1216,7 +1430,7 @@ def health_check():
             'status': 'error',
             'version': '1.0.0',
             'service': 'TORQ Tech News',
-            'timestamp': datetime.now().isoformat(),
+            'timestamp': now_iso(),
             'error': str(e),
             'components': {
                 'database': 'unknown',
@@ -1226,66 +1440,216 @@ def health_check():
         }), 500
 
 # Automation background task
+UPDATE_INTERVAL = 5 * 3600  # seconds between content updates
+RETRY_BASE_DELAY = 60  # first retry after a failed update; doubles per failure, capped at UPDATE_INTERVAL
+AUTOMATION_THREAD_NAME = 'torq-auto-update'
+AUTOMATION_NICENESS = 10  # added to the updater thread's nice value
+
+def automation_retry_delay(failures):
+    """Seconds to wait before retrying after the given number of consecutive failed updates"""
+    return min(RETRY_BASE_DELAY * 2 ** (failures - 1), UPDATE_INTERVAL)
+
+# Set to wake the automation thread for an immediate update. The process that
+# runs the thread also sets it on SIGUSR2, sent by triggers other workers handle.
+_wake = threading.Event()
+
+@app.route('/admin/trigger-update', methods=['POST'])
+def trigger_update():
+    """Wake the background automation thread to update content now
+
+    The thread runs in one process per machine (see start_background_automation);
+    a trigger handled by another worker process is forwarded to it.
+    """
+    print("[ADMIN] Content update requested")
+    if _automation['thread'] is not None:
+        _wake.set()
+    else:
+        leader = _automation_leader_pid()
+        if leader is None:
+            return jsonify({
+                "status": "unavailable",
+                "message": "Background automation is not running",
+                "timestamp": now_iso()
+            }), 503
+        os.kill(leader, signal.SIGUSR2)
+    return jsonify({
+        "status": "accepted",
+        "message": "Content update triggered",
+        "timestamp": now_iso()
+    }), 202
+
 def auto_update_content():
     """Background task to update content every 5 hours"""
-    import schedule
+    # Scraping bursts should not compete with request handling for the CPU.
+    # On Linux nice() applies to the calling thread only; elsewhere it would
+    # lower the whole server's priority, so it is left alone there. The same
+    # goes for a gevent worker, where this "thread" is a greenlet on the
+    # process's main OS thread (whose thread ID equals the PID on Linux).
+    if sys.platform.startswith('linux') and threading.get_native_id() != os.getpid():
+        try:
+            os.nice(AUTOMATION_NICENESS)
+        except OSError as e:
+            logger.warning(f"[AUTO] Could not lower updater priority: {e}")
 
     def run_update():
-        """Run the content update"""
+        """Run the content update; return True if it succeeded"""
         try:
-            print("[AUTO] Running scheduled content update...")
-            import multi_source_aggregator
-            aggregator = multi_source_aggregator.MultiSourceAggregator()
-            aggregator.fetch_all_articles()
-            print("[AUTO] Content updated successfully from multiple sources")
+            logger.info("[AUTO] Running scheduled content update...")
+            get_aggregator().fetch_all_articles()
+            logger.info("[AUTO] Content updated successfully from multiple sources")
+            return True
         except Exception as e:
-            print(f"[AUTO] Error in auto-update: {e}")
-
-    # Schedule updates every 5 hours
-    schedule.every(5).hours.do(run_update)
+            logger.error(f"[AUTO] Error in auto-update: {e}")
+            return False
 
-    print("[AUTO] Content auto-update service started")
-    print("[AUTO] Scheduled updates: Every 5 hours")
+    logger.info("[AUTO] Content auto-update service started")
+    logger.info("[AUTO] Scheduled updates: Every 5 hours")
 
-    # Run once immediately on startup
-    print("[AUTO] Running initial content update...")
-    run_update()
+    # Run once on startup, unless the aggregator refreshed the cache less than
+    # an interval ago (e.g. a restart or redeploy): then the first update is
+    # due when that content expires. The default placeholder cache written by
+    # init_data_cache has no timestamp and always counts as stale.
+    try:
+        state = load_data_cache()
+        if 'timestamp' in state['data']:
+            cache_age = time.time() - state['stamp'][0] / 1e9
+        else:
+            cache_age = float('inf')
+    except (OSError, ValueError):
+        cache_age = float('inf')
 
-    # Keep checking for scheduled tasks
+    if cache_age >= UPDATE_INTERVAL:
+        logger.info("[AUTO] Running initial content update...")
+        next_run = time.monotonic()
+    else:
+        logger.info(f"[AUTO] Content cache is fresh; first update in {int(UPDATE_INTERVAL - cache_age)}s")
+        next_run = time.monotonic() + UPDATE_INTERVAL - cache_age
+    failures = 0
+
+    # One wait per cycle, up to a monotonic deadline: the thread only wakes to
+    # update, and updates stay on a fixed 5-hour cadence however long each run
+    # takes (or if the wall clock is changed). /admin/trigger-update sets
+    # _wake to cut the wait short; the cadence then restarts from that update.
+    # A failed update is retried with exponential backoff instead of leaving
+    # the content stale until the next cycle.
     while True:
-        schedule.run_pending()
-        time.sleep(60)  # Check every minute
+        delay = next_run - time.monotonic()
+        triggered = delay > 0 and _wake.wait(timeout=delay)
+        _wake.clear()
+        if run_update():
+            failures = 0
+            if triggered:
+                next_run = time.monotonic() + UPDATE_INTERVAL
+            else:
+                next_run += UPDATE_INTERVAL
+        else:
+            failures += 1
+            retry_delay = automation_retry_delay(failures)
+            logger.warning(f"[AUTO] Retrying in {retry_delay}s (failure {failures})")
+            next_run = time.monotonic() + retry_delay
+
+# Only one updater may run per machine: several workers or processes each
+# running their own would repeat every scrape against the same sites. Under
+# gunicorn every worker tries to start it (gunicorn.conf.py); one wins the lock.
+AUTOMATION_LOCK_PATH = os.path.join(tempfile.gettempdir(), 'torq-updater.lock')
+_automation = {'thread': None, 'lock_file': None}
+_automation_lock = threading.Lock()
+
+def _acquire_automation_leader():
+    """Take the cross-process updater lock; return the open lock file, or None if another process holds it"""
+    f = open(AUTOMATION_LOCK_PATH, 'a+')
+    try:
+        fcntl.flock(f, fcntl.LOCK_EX | fcntl.LOCK_NB)
+    except BlockingIOError:
+        f.close()
+        return None
+    return f
+
+def _automation_leader_pid():
+    """PID of the process running the updater and accepting SIGUSR2, or None
+
+    The leader writes its PID into the lock file. The PID is only trusted
+    while the lock is still held, i.e. while that process is alive.
+    """
+    if fcntl is None:
+        return None
+    try:
+        with open(AUTOMATION_LOCK_PATH, 'a+') as f:
+            try:
+                fcntl.flock(f, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            except BlockingIOError:
+                f.seek(0)
+                pid = f.read().strip()
+                return int(pid) if pid.isdigit() else None
+            # Nobody holds the lock; closing the file releases it again
+            return None
+    except OSError:
+        return None
 
 # Start background automation
 def start_background_automation():
-    """Start the automation thread"""
-    thread = threading.Thread(target=auto_update_content, daemon=True)
-    thread.start()
-    print("[INFO] Background automation thread started")
+    """Start the automation thread, unless this or another process already runs one"""
+    with _automation_lock:
+        if _automation['thread'] is not None:
+            logger.info("[INFO] Background automation thread already running")
+            return
+
+        if fcntl is not None:
+            # The lock is held (file kept open) for the life of the process
+            lock_file = _acquire_automation_leader()
+            if lock_file is None:
+                logger.info("[INFO] Background automation runs in another process")
+                return
+            _automation['lock_file'] = lock_file
+
+            # Signal handlers can only be installed from the main thread;
+            # without one, the PID is not published for other workers
+            if threading.current_thread() is threading.main_thread():
+                signal.signal(signal.SIGUSR2, lambda signum, frame: _wake.set())
+                lock_file.seek(0)
+                lock_file.truncate()
+                lock_file.write(str(os.getpid()))
+                lock_file.flush()
+
+        thread = threading.Thread(target=auto_update_content, name=AUTOMATION_THREAD_NAME, daemon=True)
+        thread.start()
+        _automation['thread'] = thread
+    logger.info("[INFO] Background automation thread started")
 
 if __name__ == '__main__':
-    print("="*60)
-    print("MIT Sloan Review - Full Web Application")
-    print("="*60)
-    print()
-    print("[INFO] Initializing application...")
-    print("[INFO] Database: E:/sloan-review-landing/analytics.db")
-    print("[INFO] Advanced analytics enabled")
-    print()
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    )
+
+    logger.info("\n".join([
+        "=" * 60,
+        "MIT Sloan Review - Full Web Application",
+        "=" * 60,
+        "[INFO] Initializing application...",
+        "[INFO] Database: E:/sloan-review-landing/analytics.db",
+        "[INFO] Advanced analytics enabled",
+    ]))
+
+    ensure_initialized()
 
     # Start background automation
     start_background_automation()
 
     
     port = int(os.environ.get('PORT', 5000))
-    
-    print()
-    print("="*60)
-    print(f"[SUCCESS] Server starting on http://localhost:{port}")
-    print(f"[INFO] Admin Dashboard: http://localhost:{port}/admin")
-    print(f"[INFO] API Analytics: http://localhost:{port}/api/analytics")
-    print(f"[INFO] Advanced Analytics: http://localhost:{port}/api/analytics/advanced")
-    print("="*60)
-    print()
-    
-    app.run(host='0.0.0.0', port=port, debug=False, use_reloader=False)
+
+    logger.info("\n".join([
+        "=" * 60,
+        f"[SUCCESS] Server starting on http://localhost:{port}",
+        f"[INFO] Admin Dashboard: http://localhost:{port}/admin",
+        f"[INFO] API Analytics: http://localhost:{port}/api/analytics",
+        f"[INFO] Advanced Analytics: http://localhost:{port}/api/analytics/advanced",
+        "=" * 60,
+    ]))
+
+    # Local development server (run.bat / start_flask.bat). Production runs
+    # app:app under gunicorn with multiple gevent workers (Dockerfile,
+    # Procfile, start.sh, railway_start.py); requests here are still handled
+    # on their own threads rather than one at a time.
+    app.run(host='0.0.0.0', port=port, debug=False, use_reloader=False, threaded=True)
@@ -0,0 +1,34 @@
+#!/usr/bin/env python3
+"""Apply all source patch scripts, loading and writing each target file once"""
+import add_main_articles_route
+import add_slug_extraction
+import add_subscribe_endpoint
+from patch_utils import apply_patch_sets
+
+SCRIPTS = [add_main_articles_route, add_slug_extraction, add_subscribe_endpoint]
+
+
+def main():
+    # Group patch sets by target so each file is read, scanned and written once
+    targets = {}
+    for script in SCRIPTS:
+        targets.setdefault(script.TARGET, []).append((script.MARKER, script.PATCHES))
+
+    failed = False
+    for path, patch_sets in targets.items():
+        try:
+            applied = apply_patch_sets(path, patch_sets)
+        except LookupError as e:
+            print(f"[ERROR] {e}")
+            failed = True
+        else:
+            if applied:
+                print(f"[OK] Applied {len(applied)} patch(es) to {path}")
+            else:
+                print(f"[SKIP] {path} is already patched")
+
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    exit(main())
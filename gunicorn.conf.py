@@ -0,0 +1,11 @@
+"""Gunicorn server hooks, loaded automatically from the working directory
+
+The Dockerfile, Procfile, start.sh and railway_start.py pass every setting on
+the command line; this file only adds hooks.
+"""
+
+
+def post_worker_init(worker):
+    """Start the background content updater in the first worker that takes its lock"""
+    from app import start_background_automation
+    start_background_automation()
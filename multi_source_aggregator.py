@@ -15,16 +15,51 @@ if sys.platform.startswith('win'):
 import os
 import json
 import time
-import re
+import threading
 from datetime import datetime
 from pathlib import Path
 from typing import List, Dict, Optional
 import requests
 from bs4 import BeautifulSoup
 import random
+from concurrent.futures import ThreadPoolExecutor
 from newspaper import Article
 import hashlib
 
+# URL prefixes recognised by _extract_slug (plain startswith tests, no regex)
+_MIT_ARTICLE_PREFIXES = ('https://sloanreview.mit.edu/article/', 'http://sloanreview.mit.edu/article/')
+_HN_ITEM_PREFIXES = ('https://news.ycombinator.com/item?', 'http://news.ycombinator.com/item?')
+
+# ASCII-only str.translate table: keep a-z, 0-9 and '-', map whitespace to '-',
+# delete everything else. Non-ASCII titles are filtered down to ASCII first.
+_SLUG_KEEP = frozenset('abcdefghijklmnopqrstuvwxyz0123456789-')
+_SLUG_TABLE = {
+    c: (ord('-') if chr(c).isspace() else None)
+    for c in range(128) if chr(c) not in _SLUG_KEEP
+}
+
+
+def _slug_from_mit_url(url):
+    """Slug from an MIT Sloan /article/<slug>/ URL, or None"""
+    tail = url.partition('/article/')[2]
+    return tail.split('/', 1)[0] or None
+
+
+def _slug_from_hn_url(url):
+    """hn-<id> slug from a Hacker News item URL, or None"""
+    if not url.startswith(_HN_ITEM_PREFIXES):
+        return None
+    query = url.partition('?id=')[2] or url.partition('&id=')[2]
+    item_id = query.split('&', 1)[0]
+    return f"hn-{item_id}" if item_id.isdigit() else None
+
+
+# Source name -> URL slug extractor; sources not listed go straight to the title
+_SLUG_DISPATCH = {
+    'MIT Sloan': _slug_from_mit_url,
+    'Hacker News': _slug_from_hn_url,
+}
+
 class MultiSourceAggregator:
     """
     Intelligent aggregator that fetches from multiple tech news sources
@@ -36,6 +71,13 @@ class MultiSourceAggregator:
         self.landing_page_dir = Path(landing_page_dir)
         self.data_cache = self.landing_page_dir / "data_cache.json"
 
+        # requests.Session is not thread-safe, so each fetch thread gets its own
+        # (see the session property). The fetch threads outlive an update run,
+        # so their connections (and TLS sessions) are kept alive and reused by
+        # the next one
+        self._local = threading.local()
+        self._executor = None
+
         # News sources
         self.sources = {
             "mit_sloan": "https://sloanreview.mit.edu",
@@ -54,20 +96,43 @@ class MultiSourceAggregator:
             "Technology": {"color": "#4CAF50", "icon": "🤖"}
         }
 
+    # Per-source fetch method and article limit, in the order results are combined
+    SOURCE_FETCHERS = {
+        "techcrunch": ("fetch_techcrunch_articles", 3),
+        "mit_tech_review": ("fetch_mit_tech_review_articles", 2),
+        "hackernews": ("fetch_hackernews_articles", 2),
+        "mit_sloan": ("fetch_mit_sloan_articles", 6),
+    }
+
+    @property
+    def session(self) -> requests.Session:
+        """The calling thread's pooled HTTP session, created on first use"""
+        session = getattr(self._local, 'session', None)
+        if session is None:
+            session = self._local.session = requests.Session()
+        return session
+
+    def fetch_source(self, source: str) -> List[Dict]:
+        """Fetch articles from one source (a key of SOURCE_FETCHERS)"""
+        method, limit = self.SOURCE_FETCHERS[source]
+        return getattr(self, method)(limit)
+
     def fetch_techcrunch_articles(self, limit: int = 3) -> List[Dict]:
         """Fetch latest articles from TechCrunch"""
         print("[*] Fetching from TechCrunch...")
         articles = []
+        today = datetime.now().strftime("%B %d, %Y")  # same for the whole batch
 
         try:
             headers = {'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'}
-            response = requests.get("https://techcrunch.com/category/artificial-intelligence/",
-                                   headers=headers, timeout=10)
+            response = self.session.get("https://techcrunch.com/category/artificial-intelligence/",
+                                        headers=headers, timeout=10)
             response.raise_for_status()
 
             soup = BeautifulSoup(response.content, 'html.parser')
             article_elements = soup.find_all('article', class_='post-block', limit=limit)
 
+            reading_times = iter(random.choices(range(4, 9), k=len(article_elements)))
             for article_elem in article_elements:
                 try:
                     # Get title
@@ -98,10 +163,10 @@ class MultiSourceAggregator:
                         'image': image,
                         'category': "AI & Machine Learning",
                         'author': author,
-                        'date': datetime.now().strftime("%B %d, %Y"),
-                        'reading_time': random.randint(4, 8),
+                        'date': today,
+                        'reading_time': next(reading_times),
                         'link': link,
-                        'slug': self._extract_slug(link, title),
+                        'slug': self._extract_slug(link, title, source='TechCrunch'),
                         'source': 'TechCrunch'
                     })
                     print(f"  [OK] TechCrunch: {title[:50]}...")
@@ -118,16 +183,18 @@ class MultiSourceAggregator:
         """Fetch latest articles from MIT Technology Review"""
         print("[*] Fetching from MIT Technology Review...")
         articles = []
+        today = datetime.now().strftime("%B %d, %Y")  # same for the whole batch
 
         try:
             headers = {'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'}
-            response = requests.get("https://www.technologyreview.com/topic/artificial-intelligence/",
-                                   headers=headers, timeout=10)
+            response = self.session.get("https://www.technologyreview.com/topic/artificial-intelligence/",
+                                        headers=headers, timeout=10)
             response.raise_for_status()
 
             soup = BeautifulSoup(response.content, 'html.parser')
             article_elements = soup.find_all('article', limit=limit)
 
+            reading_times = iter(random.choices(range(8, 13), k=len(article_elements)))
             for article_elem in article_elements:
                 try:
                     # Get title
@@ -156,10 +223,10 @@ class MultiSourceAggregator:
                         'image': image,
                         'category': "Innovation",
                         'author': "MIT Technology Review",
-                        'date': datetime.now().strftime("%B %d, %Y"),
-                        'reading_time': random.randint(8, 12),
+                        'date': today,
+                        'reading_time': next(reading_times),
                         'link': link,
-                        'slug': self._extract_slug(link, title),
+                        'slug': self._extract_slug(link, title, source='MIT Tech Review'),
                         'source': 'MIT Tech Review'
                     })
                     print(f"  [OK] MIT Tech Review: {title[:50]}...")
@@ -176,17 +243,19 @@ class MultiSourceAggregator:
         """Fetch top articles from Hacker News using their API"""
         print("[*] Fetching from Hacker News...")
         articles = []
+        today = datetime.now().strftime("%B %d, %Y")  # same for the whole batch
 
         try:
             # Get top story IDs
-            response = requests.get("https://hacker-news.firebaseio.com/v0/topstories.json", timeout=10)
+            response = self.session.get("https://hacker-news.firebaseio.com/v0/topstories.json", timeout=10)
             response.raise_for_status()
             story_ids = response.json()[:limit * 3]  # Get more to filter
 
+            reading_times = iter(random.choices(range(5, 11), k=len(story_ids[:limit])))
             for story_id in story_ids[:limit]:
                 try:
                     # Get story details
-                    story_response = requests.get(
+                    story_response = self.session.get(
                         f"https://hacker-news.firebaseio.com/v0/item/{story_id}.json",
                         timeout=5
                     )
@@ -203,10 +272,10 @@ class MultiSourceAggregator:
                             'image': self._get_fallback_image(),
                             'category': "Technology",
                             'author': author,
-                            'date': datetime.now().strftime("%B %d, %Y"),
-                            'reading_time': random.randint(5, 10),
+                            'date': today,
+                            'reading_time': next(reading_times),
                             'link': url,
-                            'slug': self._extract_slug(url, title),
+                            'slug': self._extract_slug(url, title, source='Hacker News'),
                             'source': 'Hacker News'
                         })
                         print(f"  [OK] Hacker News: {title[:50]}...")
@@ -226,16 +295,18 @@ class MultiSourceAggregator:
         """Fetch articles from MIT Sloan Review"""
         print("[*] Fetching from MIT Sloan Review...")
         articles = []
+        today = datetime.now().strftime("%B %d, %Y")  # same for the whole batch
 
         try:
             headers = {'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'}
-            response = requests.get("https://sloanreview.mit.edu/topic/data-ai-machine-learning/",
-                                   headers=headers, timeout=10)
+            response = self.session.get("https://sloanreview.mit.edu/topic/data-ai-machine-learning/",
+                                        headers=headers, timeout=10)
             response.raise_for_status()
 
             soup = BeautifulSoup(response.content, 'html.parser')
             article_elements = soup.find_all('article', limit=limit)
 
+            reading_times = iter(random.choices(range(7, 13), k=len(article_elements)))
             for article_elem in article_elements:
                 try:
                     title_elem = article_elem.find(['h2', 'h3', 'h4'])
@@ -255,10 +326,10 @@ class MultiSourceAggregator:
                         'image': self._get_fallback_image(),
                         'category': "Leadership",
                         'author': "MIT Sloan Review",
-                        'date': datetime.now().strftime("%B %d, %Y"),
-                        'reading_time': random.randint(7, 12),
+                        'date': today,
+                        'reading_time': next(reading_times),
                         'link': link,
-                        'slug': self._extract_slug(link, title),
+                        'slug': self._extract_slug(link, title, source='MIT Sloan'),
                         'source': 'MIT Sloan'
                     })
                     print(f"  [OK] MIT Sloan: {title[:50]}...")
@@ -282,30 +353,38 @@ class MultiSourceAggregator:
         return f"https://images.unsplash.com/{selected}?w=800&h=600&fit=crop"
 
 
-    def _extract_slug(self, url: str, title: str = "") -> str:
-        """Extract slug from URL or generate from title"""
-        import re
-
-        # Try to extract from MIT Sloan URL
-        if "sloanreview.mit.edu/article/" in url:
-            match = re.search(r'/article/([^/]+)/?', url)
-            if match:
-                return match.group(1)
+    def _extract_slug(self, url: str, title: str = "", source: Optional[str] = None) -> str:
+        """Extract slug from URL or generate from title
 
-        # Try to extract from other URL patterns
-        if "hackernews" in url or "ycombinator" in url:
-            # For HN, use the ID
-            match = re.search(r'id=(\d+)', url)
-            if match:
-                return f"hn-{match.group(1)}"
+        When the caller knows the source, the matching URL extractor is looked
+        up directly instead of sniffing the URL for every known site.
+        """
+        if source is None:
+            # No hint: detect the site from the URL
+            if url.startswith(_MIT_ARTICLE_PREFIXES):
+                handler = _slug_from_mit_url
+            elif url.startswith(_HN_ITEM_PREFIXES):
+                handler = _slug_from_hn_url
+            else:
+                handler = None
+        else:
+            handler = _SLUG_DISPATCH.get(source)
+
+        if handler is not None:
+            slug = handler(url)
+            if slug:
+                return slug
 
         # Fallback: generate from title
         if title:
-            slug = title.lower()
-            slug = re.sub(r'[^a-z0-9\s-]', '', slug)
-            slug = re.sub(r'\s+', '-', slug)
-            slug = re.sub(r'^-+|-+$', '', slug)
-            return slug[:50]
+            # Only the first 50 characters survive; 80 leaves room for stripped ones
+            slug = title[:80].lower()
+            if not slug.isascii():
+                slug = ''.join(' ' if ch.isspace() else ch for ch in slug if ch.isascii() or ch.isspace())
+            slug = slug.translate(_SLUG_TABLE)
+            # Nested replaces collapse any run of up to 34 dashes to one
+            slug = slug.replace('----', '-').replace('---', '-').replace('--', '-').replace('--', '-')
+            return slug.strip('-')[:50]
 
         return "article"
 
@@ -364,16 +443,18 @@ class MultiSourceAggregator:
             "Google Announces Major AI Model Breakthrough",
             "New Study Shows AI Impact on Productivity"
         ]
+        today = datetime.now().strftime("%B %d, %Y")
+        reading_times = random.choices(range(4, 8), k=count)
         return [{
             'title': titles[i % len(titles)],
             'excerpt': "Latest tech news from Silicon Valley's most influential startups and companies.",
             'image': self._get_fallback_image(),
             'category': "Startups & Funding",
             'author': "TechCrunch",
-            'date': datetime.now().strftime("%B %d, %Y"),
-            'reading_time': random.randint(4, 7),
+            'date': today,
+            'reading_time': reading_times[i],
             'link': "https://techcrunch.com",
-            'slug': self._extract_slug("https://techcrunch.com", titles[i % len(titles)]),
+            'slug': self._extract_slug("https://techcrunch.com", titles[i % len(titles)], source='TechCrunch'),
             'source': 'TechCrunch'
         } for i in range(count)]
 
@@ -383,16 +464,18 @@ class MultiSourceAggregator:
             "The Future of Quantum Computing in Enterprise",
             "Breakthrough in Battery Technology Could Transform EVs"
         ]
+        today = datetime.now().strftime("%B %d, %Y")
+        reading_times = random.choices(range(10, 16), k=count)
         return [{
             'title': titles[i % len(titles)],
             'excerpt': "Deep-dive technology analysis from MIT's leading tech publication.",
             'image': self._get_fallback_image(),
             'category': "Innovation",
             'author': "MIT Technology Review",
-            'date': datetime.now().strftime("%B %d, %Y"),
-            'reading_time': random.randint(10, 15),
+            'date': today,
+            'reading_time': reading_times[i],
             'link': "https://www.technologyreview.com",
-            'slug': self._extract_slug("https://www.technologyreview.com", titles[i % len(titles)]),
+            'slug': self._extract_slug("https://www.technologyreview.com", titles[i % len(titles)], source='MIT Tech Review'),
             'source': 'MIT Tech Review'
         } for i in range(count)]
 
@@ -402,16 +485,18 @@ class MultiSourceAggregator:
             "Show HN: New Open Source ML Framework",
             "Ask HN: Best Practices for Scaling Startups"
         ]
+        today = datetime.now().strftime("%B %d, %Y")
+        reading_times = random.choices(range(3, 9), k=count)
         return [{
             'title': titles[i % len(titles)],
             'excerpt': "Trending tech discussions from the developer community.",
             'image': self._get_fallback_image(),
             'category': "Technology",
             'author': "HN Community",
-            'date': datetime.now().strftime("%B %d, %Y"),
-            'reading_time': random.randint(3, 8),
+            'date': today,
+            'reading_time': reading_times[i],
             'link': "https://news.ycombinator.com",
-            'slug': self._extract_slug("https://news.ycombinator.com", titles[i % len(titles)]),
+            'slug': self._extract_slug("https://news.ycombinator.com", titles[i % len(titles)], source='Hacker News'),
             'source': 'Hacker News'
         } for i in range(count)]
 
@@ -429,21 +514,17 @@ class MultiSourceAggregator:
 
         all_articles = []
 
-        # Fetch from each source with delays to be respectful
-        techcrunch = self.fetch_techcrunch_articles(3)
-        time.sleep(2)  # Rate limiting
-        all_articles.extend(techcrunch)
-
-        mit_tech = self.fetch_mit_tech_review_articles(2)
-        time.sleep(2)
-        all_articles.extend(mit_tech)
-
-        hackernews = self.fetch_hackernews_articles(2)
-        time.sleep(1)
-        all_articles.extend(hackernews)
-
-        mit_sloan = self.fetch_mit_sloan_articles(6)
-        all_articles.extend(mit_sloan)
+        # Every source is a different site, so fetch them all at once: the
+        # total wait is the slowest source rather than the sum of them
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=len(self.SOURCE_FETCHERS),
+                                                thread_name_prefix='aggregator-fetch')
+        results = dict(zip(self.SOURCE_FETCHERS,
+                           self._executor.map(self.fetch_source, self.SOURCE_FETCHERS)))
+
+        for source_articles in results.values():
+            all_articles.extend(source_articles)
+        techcrunch = results["techcrunch"]
 
         # Extract full article content if requested
         if extract_content:
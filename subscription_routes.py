@@ -9,10 +9,18 @@ from __future__ import annotations
 import json
 import logging
 import sqlite3
+import threading
 from pathlib import Path
 
 from flask import jsonify, request
 
+from subscribers_storage import (
+    DuplicateSubscriptionError,
+    SubscribersStorage,
+    SubscriptionError,
+    ValidationError,
+)
+
 # Logging setup
 logger = logging.getLogger(__name__)
 
@@ -20,17 +28,60 @@ logger = logging.getLogger(__name__)
 DB_PATH = Path(__file__).parent / "analytics.db"
 
 
-def register_subscription_routes(app) -> None:
+def _record_funnel_event(c, session_id: str, funnel_step: str, metadata: str) -> None:
+    """Insert a conversion_funnels row with the given cursor."""
+    c.execute(
+        '''INSERT INTO conversion_funnels (session_id, funnel_step, metadata)
+        VALUES (?, ?, ?)''',
+        (session_id, funnel_step, metadata)
+    )
+
+
+def _write_now(write, *args) -> None:
+    """Run write(cursor, *args) in its own transaction on a fresh connection.
+
+    Used when the app has no batched analytics writer to hand the write to.
+    """
+    conn = sqlite3.connect(str(DB_PATH))
+    try:
+        with conn:
+            write(conn.cursor(), *args)
+    finally:
+        conn.close()
+
+
+# Process-wide storage instance; building one sets up the Azure client and
+# SQLite schema, so it is created once and shared by all requests.
+_storage = None
+_storage_lock = threading.Lock()
+
+
+def _get_storage() -> SubscribersStorage:
+    """Return the shared SubscribersStorage, creating it on first use."""
+    global _storage
+    if _storage is None:
+        with _storage_lock:
+            if _storage is None:
+                _storage = SubscribersStorage()
+    return _storage
+
+
+def register_subscription_routes(app, queue_write=None) -> None:
     """Register subscription routes to Flask app.
 
     Args:
         app: Flask application instance.
+        queue_write: Optional queue_write(write, *args) that hands
+            write(cursor, *args) to the app's batched analytics writer
+            (app.queue_analytics_write). Without it, analytics rows are
+            written directly.
 
     Example:
         >>> from flask import Flask
         >>> app = Flask(__name__)
         >>> register_subscription_routes(app)
     """
+    track = queue_write or _write_now
 
     @app.route('/api/subscribe', methods=['POST'])
     def subscribe():
@@ -65,16 +116,8 @@ def register_subscription_routes(app) -> None:
             HTTP 500: Server error
         """
         try:
-            # Import subscribers storage module
-            from subscribers_storage import (
-                SubscribersStorage,
-                ValidationError,
-                DuplicateSubscriptionError,
-                SubscriptionError
-            )
-
-            # Parse request data
-            data = request.get_json()
+            # Parse request data (None for a missing or malformed JSON body)
+            data = request.get_json(silent=True, cache=False)
 
             if not data:
                 return jsonify({
@@ -93,26 +136,17 @@ def register_subscription_routes(app) -> None:
             # Get client IP for analytics (hashed for privacy)
             ip_address = request.remote_addr
 
-            # Initialize storage and subscribe
-            storage = SubscribersStorage()
+            # Subscribe through the shared storage instance
+            storage = _get_storage()
             result = storage.subscribe(email, ip_address)
 
             # Track subscription event in analytics
             session_id = request.cookies.get('session_id')
             if session_id:
                 try:
-                    conn = sqlite3.connect(str(DB_PATH))
-                    c = conn.cursor()
-                    c.execute(
-                        '''INSERT INTO conversion_funnels (session_id, funnel_step, metadata)
-                        VALUES (?, ?, ?)''',
-                        (session_id, 'newsletter_subscribe', json.dumps({
-                            'email_domain': email.split('@')[1],
-                            'backend': result.storage_backend
-                        }))
-                    )
-                    conn.commit()
-                    conn.close()
+                    email_domain = email.rpartition('@')[2]
+                    metadata = json.dumps({'email_domain': email_domain, 'backend': result.storage_backend})
+                    track(_record_funnel_event, session_id, 'newsletter_subscribe', metadata)
                 except Exception as e:
                     logger.warning(f"Failed to track subscription event: {e}")
 
@@ -172,9 +206,7 @@ def register_subscription_routes(app) -> None:
             JSON response with subscriber count and backend information.
         """
         try:
-            from subscribers_storage import SubscribersStorage
-
-            storage = SubscribersStorage()
+            storage = _get_storage()
             stats = storage.get_subscriber_count()
 
             return jsonify({
@@ -4,6 +4,10 @@ Basic tests for TORQ Tech News
 """
 import sys
 import os
+import contextlib
+import json
+import sqlite3
+import tempfile
 
 # Add parent directory to path
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
@@ -80,9 +84,168 @@ def test_database_initialization():
         assert False, f"Database initialization failed: {e}"
 
 
+def test_subscribe_patch_keeps_analytics_writer():
+    """Test that add_subscribe_endpoint leaves app.py's batched analytics writer in charge"""
+    import importlib.util
+    import shutil
+    import sqlite3
+    import tempfile
+    import add_subscribe_endpoint
+    from patch_utils import patch_file
+
+    root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+    with tempfile.TemporaryDirectory() as tmp:
+        # Patch a copy of app.py (with the stylesheet it hashes at import)
+        for name in ('app.py', 'article-detail.css'):
+            shutil.copy(os.path.join(root, name), tmp)
+        target = os.path.join(tmp, 'app.py')
+        assert patch_file(target, add_subscribe_endpoint.PATCHES, marker=add_subscribe_endpoint.MARKER)
+
+        spec = importlib.util.spec_from_file_location('patched_app', target)
+        patched = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(patched)
+        patched.init_db()
+
+        # A queued page view is flushed by the writer into visitors
+        patched.queue_analytics_write(patched._record_visit, 'iphash', 'pytest', '/', 'session-1', 'direct')
+        patched._stop_analytics_writer()
+
+        conn = sqlite3.connect(patched.DB_PATH)
+        rows = conn.execute('SELECT page_url, session_id FROM visitors').fetchall()
+        conn.close()
+
+    assert rows == [('/', 'session-1')]
+    print("✓ Subscription patch keeps the analytics writer")
+
+
+def test_automation_retry_backoff():
+    """Test that failed updates are retried after 60s, doubling up to the update interval"""
+    from app import automation_retry_delay, UPDATE_INTERVAL
+
+    delays = [automation_retry_delay(failures) for failures in range(1, 11)]
+    assert delays[:5] == [60, 120, 240, 480, 960]
+    assert delays[-1] == UPDATE_INTERVAL
+    assert all(a <= b for a, b in zip(delays, delays[1:]))
+    print("✓ Automation retry backoff starts at 60s and is capped")
+
+
+@contextlib.contextmanager
+def temp_app_storage():
+    """Point app's database and data cache at a temporary directory"""
+    import app as app_module
+
+    saved = {name: getattr(app_module, name) for name in ('DB_PATH', 'DATA_CACHE_PATH', '_initialized')}
+    with tempfile.TemporaryDirectory() as tmp:
+        app_module.DB_PATH = os.path.join(tmp, 'analytics.db')
+        app_module.DATA_CACHE_PATH = os.path.join(tmp, 'data_cache.json')
+        app_module._initialized = False
+        try:
+            yield app_module
+        finally:
+            # Flush and stop this directory's writer; the next write starts a new one
+            app_module._stop_analytics_writer()
+            app_module._analytics_writer = None
+            for name, value in saved.items():
+                setattr(app_module, name, value)
+
+
+def test_analytics_writer_flushes_on_shutdown():
+    """Test that every queued analytics write is committed, across batches, when the writer stops"""
+    with temp_app_storage() as app_module:
+        app_module.init_db()
+        saved_batch_size = app_module.ANALYTICS_BATCH_SIZE
+        app_module.ANALYTICS_BATCH_SIZE = 3
+        try:
+            for n in range(7):
+                app_module.queue_analytics_write(app_module._record_visit, 'iphash', 'pytest', f'/{n}', 'session-1', 'direct')
+            # A failing write is skipped without losing the rest of its batch
+            app_module.queue_analytics_write(lambda c: c.execute('INSERT INTO no_such_table VALUES (1)'))
+            app_module.queue_analytics_write(app_module._record_visit, 'iphash', 'pytest', '/last', 'session-1', 'direct')
+            app_module._stop_analytics_writer()
+        finally:
+            app_module.ANALYTICS_BATCH_SIZE = saved_batch_size
+
+        assert not app_module._analytics_writer.is_alive()
+        conn = sqlite3.connect(app_module.DB_PATH)
+        pages = [row[0] for row in conn.execute('SELECT page_url FROM visitors ORDER BY id')]
+        total = conn.execute("SELECT value FROM meta WHERE key = 'total_views'").fetchone()[0]
+        conn.close()
+
+    assert pages == [f'/{n}' for n in range(7)] + ['/last']
+    assert total == 8
+    print("✓ Analytics writer flushes every queued write on shutdown")
+
+
+def test_article_slug_prefix_lookup():
+    """Test that an unknown slug falls back to the earliest article sharing its first 20 characters"""
+    articles = [
+        {'slug': 'quantum-computing-breakthrough-followup', 'title': 'Followup Story'},
+        {'slug': 'ai-chips-roadmap', 'title': 'Chips Story'},
+        {'slug': 'quantum-computing-breakthrough', 'title': 'Original Story'},
+    ]
+    with temp_app_storage() as app_module:
+        with open(app_module.DATA_CACHE_PATH, 'w', encoding='utf-8') as f:
+            json.dump({'featured': {'slug': 'featured-story', 'title': 'Featured Story'}, 'articles': articles}, f)
+        client = app_module.app.test_client()
+
+        exact = client.get('/article/quantum-computing-breakthrough')
+        # Sorts before the followup, but the followup comes first in the cache
+        fuzzy = client.get('/article/quantum-computing-breakthrough-2026')
+        missing = client.get('/article/ai-chips-roadmap-v2')
+
+    assert exact.status_code == 200 and b'Original Story' in exact.data
+    assert fuzzy.status_code == 200 and b'Followup Story' in fuzzy.data
+    assert missing.status_code == 404
+    print("✓ Article lookup falls back to slug prefix matches")
+
+
+def test_health_cache_invalidation():
+    """Test that /health reuses its body until the data cache, visitor total or timestamp changes"""
+    with temp_app_storage() as app_module:
+        saved_now_iso = app_module.now_iso
+        app_module.now_iso = lambda: '2026-01-01T00:00:00'
+        try:
+            with open(app_module.DATA_CACHE_PATH, 'w', encoding='utf-8') as f:
+                json.dump({'articles': [{'slug': 'one'}]}, f)
+            client = app_module.app.test_client()
+
+            first = client.get('/health').get_json()
+            cached = app_module._health_cache
+            client.get('/health')
+            assert app_module._health_cache is cached
+
+            # A new visitor bumps the trigger-maintained total
+            conn = sqlite3.connect(app_module.DB_PATH)
+            conn.execute("INSERT INTO visitors (page_url, session_id) VALUES ('/', 'session-1')")
+            conn.commit()
+            conn.close()
+            visitors = client.get('/health').get_json()
+
+            # Rewriting the data cache changes its (mtime, size) stamp
+            with open(app_module.DATA_CACHE_PATH, 'w', encoding='utf-8') as f:
+                json.dump({'articles': [{'slug': 'one'}, {'slug': 'two'}]}, f)
+            articles = client.get('/health').get_json()
+
+            app_module.now_iso = lambda: '2026-01-01T00:00:01'
+            later = client.get('/health').get_json()
+        finally:
+            app_module.now_iso = saved_now_iso
+
+    assert first['data']['total_visitors'] == 0 and first['data']['article_count'] == 1
+    assert visitors['data']['total_visitors'] == 1
+    assert articles['data']['article_count'] == 2
+    assert later['timestamp'] == '2026-01-01T00:00:01'
+    print("✓ Health check cache is rebuilt when its inputs change")
+
+
 if __name__ == '__main__':
     test_app_imports()
     test_aggregator_imports()
     test_subscription_routes_imports()
     test_database_initialization()
+    test_subscribe_patch_keeps_analytics_writer()
+    test_automation_retry_backoff()
+    test_analytics_writer_flushes_on_shutdown()
+    test_article_slug_prefix_lookup()
+    test_health_cache_invalidation()
     print("\n✅ All tests passed!")